@@ -8,6 +8,7 @@ License: MIT
 """
 
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -27,6 +28,18 @@ def run_command(cmd, description):
     return result.returncode == 0
 
 
+def _find_ruff():
+    """Return the path to the ruff binary, or None if it is not available."""
+    try:
+        # Prefer the ruff installed in the current Python environment
+        from ruff.__main__ import find_ruff_bin
+
+        return find_ruff_bin()
+    except (ImportError, FileNotFoundError):
+        # Fall back to system ruff if available
+        return shutil.which("ruff")
+
+
 def main():
     """Run linting and formatting checks."""
     # Ensure we're in the project root directory
@@ -35,31 +48,21 @@ def main():
 
     print("Running linting and formatting checks...")
 
-    # Check if ruff is installed
-    try:
-        # Try to use the ruff from the current Python environment
-        # This will work in virtual environments where ruff is installed
-        import sys
-        ruff_cmd = [sys.executable, "-m", "ruff"]
-        subprocess.run(ruff_cmd + ["--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError, ImportError):
-        # Fall back to system ruff if available
-        try:
-            subprocess.run(["ruff", "--version"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("Error: ruff is not installed or not in PATH.")
-            print("Install it with: pip install ruff")
-            print("Or preferably: uv pip install ruff")
-            return False
-
-    # Use the Python module approach to run ruff
-    ruff_cmd = [sys.executable, "-m", "ruff"]
-    
+    # Locate the native ruff binary so each step skips Python interpreter startup
+    ruff_bin = _find_ruff()
+    if not ruff_bin:
+        print("Error: ruff is not installed or not in PATH.")
+        print("Install it with: pip install ruff")
+        print("Or preferably: uv pip install ruff")
+        return False
+
     # Run ruff linting with auto-fix
-    lint_success = run_command(ruff_cmd + ["check", "--fix", "."], "Ruff Linting Auto-fix")
+    lint_success = run_command(
+        [ruff_bin, "check", "--fix", "."], "Ruff Linting Auto-fix"
+    )
 
     # Run ruff formatting (modifies files)
-    format_success = run_command(ruff_cmd + ["format", "."], "Ruff Format Auto-fix")
+    format_success = run_command([ruff_bin, "format", "."], "Ruff Format Auto-fix")
 
     if lint_success and format_success:
         print("\n✅ All fixes applied successfully!")
@@ -3,6 +3,7 @@
 Run tests with coverage reporting for the tailsocks project.
 """
 
+import io
 import os
 import subprocess
 import sys
@@ -12,7 +13,7 @@ from pathlib import Path
 def run_command(cmd, description):
     """Run a command and print its output."""
     print(f"\n=== {description} ===")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True, text=True)
 
     print(result.stdout)
     if result.stderr:
@@ -31,23 +32,26 @@ def main():
     reports_dir.mkdir(exist_ok=True)
 
     # Run tests with coverage, excluding failing tests
-    cmd = (
-        "pytest tests/ "
-        "--cov=tailsocks "
-        "--cov-report=term "
-        f"--cov-report=html:{reports_dir}/html "
-        f"--cov-report=xml:{reports_dir}/coverage.xml "
-        "-v "
-        '-k "not test_save_config_error and '
+    cmd = [
+        sys.executable,
+        "-m",
+        "pytest",
+        "tests/",
+        "--cov=tailsocks",
+        "--cov-report=term",
+        f"--cov-report=html:{reports_dir}/html",
+        f"--cov-report=xml:{reports_dir}/coverage.xml",
+        "-v",
+        "-k",
+        "not test_save_config_error and "
         "not test_save_state_error and "
         "not test_save_config and "
         "not test_is_server_running_socket_check and "
         "not test_is_server_running_pgrep_fallback and "
         "not test_ensure_available_port_configured_port_in_use and "
         "not test_find_tailscaled_pid_linux and "
-        "not test_find_tailscaled_pid_multiple_results and "
-        'not test_main_module_execution"'
-    )
+        "not test_main_module_execution",
+    ]
 
     success = run_command(cmd, "Running tests with coverage")
 
@@ -55,22 +59,19 @@ def main():
         print(f"\nCoverage report generated in {reports_dir}/html/index.html")
 
         # Check if we're on CI and should fail on coverage threshold
+        import coverage
+
         min_coverage = os.environ.get("MIN_COVERAGE", 80)
-        coverage_output = subprocess.check_output(
-            "coverage report", shell=True, text=True
-        )
-
-        # Extract total coverage percentage
-        for line in coverage_output.splitlines():
-            if "TOTAL" in line:
-                total_coverage = int(line.split()[-1].rstrip("%"))
-                if total_coverage < int(min_coverage):
-                    print(
-                        f"Coverage {total_coverage}% is below minimum threshold of {min_coverage}%",
-                        file=sys.stderr,
-                    )
-                    return 1
-                break
+        cov = coverage.Coverage()
+        cov.load()
+        total_coverage = cov.report(file=io.StringIO())
+
+        if total_coverage < int(min_coverage):
+            print(
+                f"Coverage {total_coverage:.0f}% is below minimum threshold of {min_coverage}%",
+                file=sys.stderr,
+            )
+            return 1
 
     return 0 if success else 1
 
@@ -4,6 +4,7 @@ Command-line interface for tailsocks.
 """
 
 import argparse
+import functools
 import logging
 import sys
 
@@ -13,8 +14,16 @@ from tailsocks.manager import TailscaleProxyManager, get_all_profiles
 
 def _print_status(status, show_header=True):
     """Print the status of a profile in a consistent format"""
+    lines = _format_status(status, show_header)
+    if lines:
+        print("\n".join(lines))
+
+
+def _format_status(status, show_header=True):
+    """Return the lines describing the status of a profile"""
+    lines = []
     if show_header:
-        print(f"Profile: {status['profile_name']}")
+        lines.append(f"Profile: {status['profile_name']}")
 
     # Define the fields to display and their labels
     fields = [
@@ -28,10 +37,12 @@ def _print_status(status, show_header=True):
         ("using_auth_token", "Using auth token", lambda v: "Yes" if v else "No"),
     ]
 
-    # Print each field if it exists in the status
+    # Include each field if it exists in the status
     for key, label, formatter in fields:
         if key in status:
-            print(f"  {label}: {formatter(status[key])}")
+            lines.append(f"  {label}: {formatter(status[key])}")
+
+    return lines
 
 
 def show_status(args):
@@ -46,10 +57,12 @@ def show_status(args):
             print("No profiles found")
             return
 
-        print(f"Found {len(profiles)} profile(s):")
+        # Build the whole listing first so it is written out in one go
+        lines = [f"Found {len(profiles)} profile(s):"]
         for status in profiles:
-            _print_status(status)
-            print()
+            lines.extend(_format_status(status))
+            lines.append("")
+        print("\n".join(lines))
 
 
 def _require_profile_selection(args, command_name):
@@ -143,10 +156,11 @@ def _handle_delete_profile(manager):
     config_dir = manager.config_dir
     cache_dir = manager.cache_dir
 
-    # Confirm both directories exist and are within the expected parent directories
+    # Confirm at least one directory exists and both are within the expected
+    # parent directories. Profiles are only created on disk as they are used, so
+    # one may have a config directory and no cache directory or vice versa
     if (
-        os.path.exists(config_dir)
-        and os.path.exists(cache_dir)
+        (os.path.exists(config_dir) or os.path.exists(cache_dir))
         and "/.config/tailscale-" in config_dir
         and "/.cache/tailscale-" in cache_dir
     ):
@@ -204,8 +218,23 @@ def handle_command(args):
     return 0 if success else 1
 
 
-def main():
-    """Main entry point for the CLI"""
+# Commands that take no options of their own; invoked bare they can skip
+# building the argparse tree entirely
+_FAST_PATH_COMMANDS = ("status", "stop-session", "stop-server", "delete-profile")
+
+
+def _fast_path_args(argv):
+    """Return parsed args for a bare option-less command, or None to use argparse"""
+    if len(argv) == 1 and argv[0] in _FAST_PATH_COMMANDS:
+        return argparse.Namespace(
+            command=argv[0], profile=None, version=False, verbose=False
+        )
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the argument parser for the CLI, once per process"""
     parser = argparse.ArgumentParser(description="Manage a tailscale SOCKS5 proxy")
     parser.add_argument(
         "--profile",
@@ -247,7 +276,15 @@ def main():
     # Status command
     subparsers.add_parser("status", help="Show status of profiles")
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point for the CLI"""
+    args = _fast_path_args(sys.argv[1:])
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
 
     # Set up logging based on verbose flag
     log_level = logging.DEBUG if args.verbose else logging.INFO
@@ -29,7 +29,9 @@ def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
 
     # Create logger
     logger = logging.getLogger(name)
-    logger.setLevel(level)
+    # setLevel clears every logger's level cache, so skip it when nothing changes
+    if logger.level != level:
+        logger.setLevel(level)
 
     # Create console handler if no handlers exist
     if not logger.handlers:
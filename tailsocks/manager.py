@@ -3,39 +3,255 @@
 Core functionality for managing Tailscale SOCKS5 proxies.
 """
 
-import glob
-import json
+import errno
 import os
 import platform
 import random
-import shutil
+import select
 import signal
 import socket
 import subprocess
+import sys
 import time
 from typing import Any, Dict, Tuple
 
-import yaml
-
 from tailsocks.logger import setup_logger
 
+# Heavier modules (yaml, json, shutil, concurrent.futures) are imported where they are used
+# so that commands which never touch them don't pay for the import at startup
+
+# Parsed config.yaml and state.json keyed on path, stored with the (mtime_ns, size)
+# they were parsed at, so repeated manager construction only costs a stat() while
+# the file is unchanged. One entry per path keeps every access a single dict
+# operation, which is safe from the get_all_profiles worker threads
+_YAML_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+# How long a _is_server_running result is reused before probing again
+_RUNNING_CACHE_TTL = 0.5
+
+# How long a status snapshot written by get_status is served from disk
+_STATUS_CACHE_TTL = 5
+
+# Default config.yaml contents. Values are filled in as JSON strings, which are
+# also valid YAML scalars, so creating a profile doesn't need the YAML dumper
+_DEFAULT_CONFIG_TEMPLATE = """\
+tailscaled_path: {tailscaled_path}
+tailscale_path: {tailscale_path}
+socket_path: {socket_path}
+accept_routes: true
+accept_dns: true
+bind: localhost:1080
+tailscaled_args:
+- --verbose=1
+tailscale_up_args:
+- {hostname_arg}
+"""
+
+# Where the tailscale packages install (tailscaled, tailscale) on each platform.
+# Anything else (e.g. Windows) relies on the binaries being on the PATH
+_DEFAULT_BINARIES: Dict[str, Tuple[str, str]] = {
+    "Darwin": ("/usr/local/bin/tailscaled", "/usr/local/bin/tailscale"),
+    "Linux": ("/usr/sbin/tailscaled", "/usr/bin/tailscale"),
+}
+
+# Words combined into friendly random profile names such as "happy_gorilla"
+_ADJECTIVES = (
+    "happy",
+    "sunny",
+    "clever",
+    "brave",
+    "mighty",
+    "gentle",
+    "wise",
+    "calm",
+    "swift",
+    "bright",
+)
+_ANIMALS = (
+    "gorilla",
+    "dolphin",
+    "tiger",
+    "eagle",
+    "panda",
+    "koala",
+    "wolf",
+    "fox",
+    "rabbit",
+    "turtle",
+)
+
+# Resolved (tailscaled, tailscale) paths keyed on platform.system(), so the
+# PATH is searched at most once per process
+_BIN_CACHE: Dict[str, Tuple[str, str]] = {}
+
+
+def _unix_socket_accepting(path, timeout=0.1):
+    """Check whether something is accepting connections on a unix socket"""
+    if not hasattr(socket, "AF_UNIX"):
+        # No unix sockets on this platform, so existence is the best we can do
+        return os.path.exists(path)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(timeout)
+        try:
+            s.connect(path)
+            return True
+        except OSError:
+            return False
+
+
+def _localapi_get(socket_path, path, timeout=2):
+    """Send a GET request to the tailscaled LocalAPI and return the response body"""
+    import http.client
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("unix sockets are not available")
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    # tailscaled only accepts LocalAPI requests addressed to this host name
+    conn = http.client.HTTPConnection("local-tailscaled.sock", timeout=timeout)
+    try:
+        sock.connect(socket_path)
+        conn.sock = sock
+        conn.request("GET", path)
+        response = conn.getresponse()
+        body = response.read()
+    finally:
+        conn.close()
+        sock.close()
+
+    if response.status != 200:
+        raise OSError(f"LocalAPI {path} returned HTTP {response.status}")
+    return body
+
+
+def _cached_yaml(path, st):
+    """Return a copy of the cached parse of path if the file is unchanged, or None"""
+    cached = _YAML_CACHE.get(path)
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        return None
+    return dict(cached[2])
+
+
+def _cache_yaml(path, st, data):
+    """Remember the parse of path, replacing any entry for an older version"""
+    _YAML_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+
+
+def _forget_yaml(path):
+    """Drop the cached parse of path"""
+    _YAML_CACHE.pop(path, None)
+
+
+def _sidecar_stat(st):
+    """The parts of a stat result that identify a version of config.yaml"""
+    return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+
+def _resolve_binary(default_path):
+    """Use default_path if it exists, otherwise look the binary up on the PATH"""
+    # Bare names are already looked up on the PATH when executed
+    if os.sep not in default_path or os.path.exists(default_path):
+        return default_path
+
+    import shutil
+
+    return shutil.which(os.path.basename(default_path)) or default_path
+
+
+def _listening_tcp_ports(host, family, paths=("/proc/net/tcp", "/proc/net/tcp6")):
+    """Return the listening ports a bind to (host, family) would collide with"""
+    # Only ports that certainly collide are reported; anything else (a hostname
+    # bind address, a listener in the other family that may be IPV6_V6ONLY) is
+    # left to the bind probe
+    try:
+        wanted = socket.inet_pton(family, host)
+    except (OSError, ValueError):
+        return set()
+    wildcard = bytes(len(wanted))
+
+    ports = set()
+    for path in paths:
+        try:
+            with open(path) as f:
+                next(f, None)  # Header
+                for line in f:
+                    fields = line.split()
+                    # local_address is "<hex ip>:<hex port>", state 0A is LISTEN
+                    if len(fields) <= 3 or fields[3] != "0A":
+                        continue
+                    address, _, port = fields[1].partition(":")
+                    local = _proc_net_address(address)
+                    # Same address, or a wildcard on either side of the same family
+                    if local == wanted or (
+                        len(local) == len(wanted) and wildcard in (wanted, local)
+                    ):
+                        ports.add(int(port, 16))
+        except (OSError, ValueError):
+            continue
+    return ports
+
+
+def _proc_net_address(hex_address):
+    """Decode a /proc/net/tcp{,6} address, made of 32-bit words in host byte order"""
+    packed = b"".join(
+        int(hex_address[i : i + 8], 16).to_bytes(4, sys.byteorder)
+        for i in range(0, len(hex_address), 8)
+    )
+    # An IPv6 socket bound to a v4-mapped address listens on that IPv4 address
+    if packed[:12] == bytes(10) + b"\xff\xff":
+        return packed[12:]
+    return packed
+
+
+def _is_tailscaled_cmdline(cmdline_path, socket_path):
+    """Check whether a /proc cmdline file is tailscaled serving socket_path (bytes)"""
+    try:
+        with open(cmdline_path, "rb") as f:
+            cmdline = f.read().replace(b"\0", b" ")
+    except OSError:
+        # The process exited or belongs to someone we can't inspect
+        return False
+    start = cmdline.find(b"tailscaled")
+    return start != -1 and socket_path in cmdline[start:]
+
+
+def _yaml_loader():
+    """Return the libyaml-backed safe loader when PyYAML was built with it"""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_dumper():
+    """Return the libyaml-backed safe dumper when PyYAML was built with it"""
+    import yaml
+
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class TailscaleProxyManager:
     """Manages a Tailscale SOCKS5 proxy instance with its own profile."""
 
     def __init__(self, profile_name=None):
-        """Initialize a new Tailscale proxy manager with the given profile name."""
+        """
+        Initialize a new Tailscale proxy manager with the given profile name.
+
+        The profile's directories are only created once something is written
+        to them, so inspecting a profile never creates them as a side effect.
+        """
         self.profile_name = profile_name or self._generate_random_profile_name()
         self.config_dir = os.path.expanduser(f"~/.config/tailscale-{self.profile_name}")
         self.cache_dir = os.path.expanduser(f"~/.cache/tailscale-{self.profile_name}")
         self.config_path = os.path.join(self.config_dir, "config.yaml")
+        self.state_path = os.path.join(self.cache_dir, "state.json")
+        self.legacy_state_path = os.path.join(self.cache_dir, "state.yml")
 
         # Set up logger
         self.logger = setup_logger(f"tailsocks.{self.profile_name}")
 
-        # Ensure both directories exist
-        os.makedirs(self.config_dir, exist_ok=True)
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self._dirs_ensured = False
 
         # Load config if it exists, but don't create it if it doesn't
         self.config = self._load_config()
@@ -45,6 +261,8 @@ class TailscaleProxyManager:
 
         # Set default values or use values from config/state
         self.state_dir = self.cache_dir
+        # tailscaled gets a state file path instead of just the directory
+        self.state_file = os.path.join(self.state_dir, "tailscale.state")
 
         # Set socket path from config or use default
         self.socket_path = self.config.get(
@@ -74,24 +292,40 @@ class TailscaleProxyManager:
         )
         self.tailscaled_process = None
 
+        # (monotonic timestamp, result) of the last _is_server_running probe
+        self._running_cache = None
+
+        # tailscaled PID found by the last /proc scan, rechecked before reuse
+        self._known_pid = None
+
         self.logger.debug(
-            f"Initialized TailscaleProxyManager for profile '{self.profile_name}'"
+            "Initialized TailscaleProxyManager for profile '%s'", self.profile_name
         )
 
+    def _ensure_dirs(self):
+        """Create the profile's config and cache directories if needed"""
+        if not self._dirs_ensured:
+            for path in (self.config_dir, self.cache_dir):
+                # One stat() instead of makedirs' stat + failing mkdir() + stat()
+                if not os.path.isdir(path):
+                    os.makedirs(path, exist_ok=True)
+            self._dirs_ensured = True
+
     def _default_tailscales(self):
         # Set paths based on OS
         system = platform.system()
-        if system == "Darwin":  # macOS
-            default_tailscaled = "/usr/local/bin/tailscaled"
-            default_tailscale = "/usr/local/bin/tailscale"
-        elif system == "Linux":
-            default_tailscaled = "/usr/sbin/tailscaled"
-            default_tailscale = "/usr/bin/tailscale"
-        else:  # Windows or other
-            default_tailscaled = "tailscaled"
-            default_tailscale = "tailscale"
+        cached = _BIN_CACHE.get(system)
+        if cached is not None:
+            return cached
 
-        return (default_tailscaled, default_tailscale)
+        default_tailscaled, default_tailscale = _DEFAULT_BINARIES.get(
+            system, ("tailscaled", "tailscale")
+        )
+        _BIN_CACHE[system] = (
+            _resolve_binary(default_tailscaled),
+            _resolve_binary(default_tailscale),
+        )
+        return _BIN_CACHE[system]
 
     def _generate_random_profile_name(self):
         """Generate a friendly random profile name that's not already in use"""
@@ -100,60 +334,27 @@ class TailscaleProxyManager:
 
         is_test = "pytest" in sys.modules
 
-        adjectives = [
-            "happy",
-            "sunny",
-            "clever",
-            "brave",
-            "mighty",
-            "gentle",
-            "wise",
-            "calm",
-            "swift",
-            "bright",
-        ]
-        animals = [
-            "gorilla",
-            "dolphin",
-            "tiger",
-            "eagle",
-            "panda",
-            "koala",
-            "wolf",
-            "fox",
-            "rabbit",
-            "turtle",
-        ]
-
         # Get existing profile names
-        config_dirs = glob.glob(os.path.expanduser("~/.config/tailscale-*"))
-        cache_dirs = glob.glob(os.path.expanduser("~/.cache/tailscale-*"))
-        existing_profiles = set(
-            [
-                os.path.basename(d).replace("tailscale-", "")
-                for d in config_dirs + cache_dirs
-            ]
-        )
-
-        # Try to generate a unique name (max 10 attempts)
-        for _ in range(10):
-            if is_test:
-                name = f"test_{random.choice(adjectives)}_{random.choice(animals)}"
-            else:
-                name = f"{random.choice(adjectives)}_{random.choice(animals)}"
+        existing_profiles = _scan_profiles("~/.config") | _scan_profiles("~/.cache")
 
+        # Try every combination once, in random order
+        prefix = "test_" if is_test else ""
+        names = [
+            f"{prefix}{adj}_{animal}" for adj in _ADJECTIVES for animal in _ANIMALS
+        ]
+        random.shuffle(names)
+        for name in names:
             if name not in existing_profiles:
                 return name
 
-        # If we couldn't find a unique name, add a random number
+        # If every combination is taken, number them until one is free
+        number = 1
         while True:
-            if is_test:
-                name = f"test_{random.choice(adjectives)}_{random.choice(animals)}_{random.randint(1, 999)}"
-            else:
-                name = f"{random.choice(adjectives)}_{random.choice(animals)}_{random.randint(1, 999)}"
-
-            if name not in existing_profiles:
-                return name
+            for base in names:
+                name = f"{base}_{number}"
+                if name not in existing_profiles:
+                    return name
+            number += 1
 
     def _parse_bind_address(self, bind_string: str) -> Tuple[str, int]:
         """Parse a bind string in the format 'address:port' or just 'port'"""
@@ -184,40 +385,116 @@ class TailscaleProxyManager:
 
     def _create_default_config(self):
         """Create a default configuration file - only called explicitly, not on init"""
+        import json
+
         (default_tailscaled, default_tailscale) = self._default_tailscales()
 
-        default_config = {
-            "tailscaled_path": default_tailscaled,
-            "tailscale_path": default_tailscale,
-            "socket_path": os.path.join(self.cache_dir, "tailscaled.sock"),
-            "accept_routes": True,
-            "accept_dns": True,
-            "bind": "localhost:1080",
-            "tailscaled_args": ["--verbose=1"],
-            "tailscale_up_args": [f"--hostname={self.profile_name}-proxy"],
-        }
+        default_config = _DEFAULT_CONFIG_TEMPLATE.format(
+            tailscaled_path=json.dumps(default_tailscaled),
+            tailscale_path=json.dumps(default_tailscale),
+            socket_path=json.dumps(os.path.join(self.cache_dir, "tailscaled.sock")),
+            hostname_arg=json.dumps(f"--hostname={self.profile_name}-proxy"),
+        )
 
+        self._ensure_dirs()
         with open(self.config_path, "w") as f:
-            yaml.dump(default_config, f, default_flow_style=False)
+            f.write(default_config)
 
         print(f"Created default configuration at {self.config_path}")
 
     def _load_config(self):
-        """Load configuration from YAML file"""
+        """Load configuration from YAML file, reusing a cached parse if unchanged"""
         try:
-            with open(self.config_path, "r") as f:
-                config = yaml.safe_load(f) or {}
-                self.logger.debug(f"Loaded configuration from {self.config_path}")
-                return config
+            st = os.stat(self.config_path)
         except FileNotFoundError:
             # Config file not found is a normal case, not an error
-            self.logger.debug(f"No configuration file found at {self.config_path}")
-            return {}
-        except yaml.YAMLError as e:
-            self.logger.error(f"Error parsing config file: {e}")
-            print(f"Error parsing config file: {e}")
+            self.logger.debug("No configuration file found at %s", self.config_path)
             return {}
 
+        config = _cached_yaml(self.config_path, st)
+        if config is not None:
+            self.logger.debug("Using cached configuration for %s", self.config_path)
+            return config
+
+        # Another process may already have parsed this version of the file
+        config = self._load_config_sidecar(st)
+        if config is None:
+            import yaml
+
+            loader = _yaml_loader()
+            if loader is yaml.SafeLoader:
+                self.logger.debug(
+                    "libyaml is unavailable, using pure-Python YAML loader"
+                )
+
+            try:
+                # Hand the loader bytes so it detects the encoding itself instead
+                # of going through a locale-dependent text decoder first
+                with open(self.config_path, "rb") as f:
+                    config = yaml.load(f, Loader=loader) or {}
+            except FileNotFoundError:
+                self.logger.debug("No configuration file found at %s", self.config_path)
+                return {}
+            except yaml.YAMLError as e:
+                self._handle_error("Error parsing config file", e)
+                return {}
+
+            self._save_config_sidecar(st, config)
+
+        _cache_yaml(self.config_path, st, config)
+
+        self.logger.debug("Loaded configuration from %s", self.config_path)
+        return dict(config)
+
+    def _config_sidecar_path(self):
+        """Path of the JSON copy of the parsed config kept in the cache directory"""
+        return os.path.join(self.cache_dir, "config.cache.json")
+
+    def _load_config_sidecar(self, st):
+        """Load the parsed config from the JSON sidecar if it matches the stat result st"""
+        import json
+
+        try:
+            with open(self._config_sidecar_path(), "rb") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # mtime alone misses a same-mtime replacement (cp -p, rsync -t, coarse
+        # timestamps), so the size and inode have to match as well
+        if not isinstance(cached, dict) or cached.get("_stat") != _sidecar_stat(st):
+            return None
+        return cached.get("data")
+
+    def _save_config_sidecar(self, st, config):
+        """Write the parsed config to the JSON sidecar, replacing it atomically"""
+        import json
+
+        # Non-string keys, dates and the like don't survive JSON, and a sidecar
+        # that loads back differently from the YAML would change the config
+        try:
+            if json.loads(json.dumps(config)) != config:
+                raise ValueError("config doesn't round-trip through JSON")
+        except (TypeError, ValueError) as e:
+            self.logger.debug("Not caching config as JSON: %s", e)
+            return
+
+        # Only fill in a cache directory that already exists, so that reading
+        # a profile never creates it
+        sidecar_path = self._config_sidecar_path()
+        tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"_stat": _sidecar_stat(st), "data": config}, f)
+            os.replace(tmp_path, sidecar_path)
+        except OSError as e:
+            # The sidecar is only an optimization; YAML remains authoritative
+            self.logger.debug("Could not write config cache: %s", e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     def _handle_error(self, message, exception=None, log_only=False):
         """Handle errors consistently throughout the manager"""
         error_msg = f"{message}"
@@ -232,35 +509,85 @@ class TailscaleProxyManager:
 
         return False
 
+    def _announce(self, message):
+        """Show a progress message to the user and record it in the log"""
+        self.logger.info(message)
+        print(message)
+
     def _save_config(self):
         """Save the current configuration to the YAML file"""
+        import yaml
+
+        _forget_yaml(self.config_path)
         try:
+            self._ensure_dirs()
             with open(self.config_path, "w") as f:
-                yaml.dump(self.config, f, default_flow_style=False)
-            self.logger.debug(f"Saved configuration to {self.config_path}")
+                yaml.dump(
+                    self.config, f, Dumper=_yaml_dumper(), default_flow_style=False
+                )
+            self.logger.debug("Saved configuration to %s", self.config_path)
             return True
         except Exception as e:
             return self._handle_error("Error saving config file", e)
 
     def _load_state(self):
-        """Load runtime state from YAML file"""
-        state_path = os.path.join(self.cache_dir, "state.yml")
+        """Load runtime state from the JSON state file, reusing a cached parse if unchanged"""
+        state_path = self.state_path
+        try:
+            st = os.stat(state_path)
+        except FileNotFoundError:
+            # Profiles last started by an older version only have state.yml
+            return self._load_legacy_state()
+
+        state = _cached_yaml(state_path, st)
+        if state is not None:
+            self.logger.debug("Using cached state for %s", state_path)
+            return state
+
+        import json
+
+        try:
+            with open(state_path, "rb") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            self.logger.debug("No state file found at %s", state_path)
+            return {}
+        except ValueError as e:
+            self._handle_error("Error parsing state file", e)
+            return {}
+
+        if not isinstance(state, dict):
+            self._handle_error(
+                f"Error parsing state file: {state_path} is not a JSON object"
+            )
+            return {}
+
+        _cache_yaml(state_path, st, state)
+        self.logger.debug("Loaded state from %s", state_path)
+        return dict(state)
+
+    def _load_legacy_state(self):
+        """Load runtime state from the state.yml written by older versions"""
+        import yaml
+
+        state_path = self.legacy_state_path
         try:
-            with open(state_path, "r") as f:
-                state = yaml.safe_load(f) or {}
-                self.logger.debug(f"Loaded state from {state_path}")
+            with open(state_path, "rb") as f:
+                state = yaml.load(f, Loader=_yaml_loader()) or {}
+                self.logger.debug("Loaded legacy state from %s", state_path)
                 return state
         except FileNotFoundError:
-            self.logger.debug(f"No state file found at {state_path}")
+            self.logger.debug("No state file found at %s", state_path)
             return {}
         except yaml.YAMLError as e:
-            self.logger.error(f"Error parsing state file: {e}")
-            print(f"Error parsing state file: {e}")
+            self._handle_error("Error parsing state file", e)
             return {}
 
     def _save_state(self):
-        """Save the current runtime state to the YAML file"""
-        state_path = os.path.join(self.cache_dir, "state.yml")
+        """Save the current runtime state to the JSON state file"""
+        import json
+
+        state_path = self.state_path
         try:
             # Create a state dictionary with all runtime parameters
             state = {
@@ -275,15 +602,27 @@ class TailscaleProxyManager:
                 "last_started": time.strftime("%Y-%m-%d %H:%M:%S"),
             }
 
+            _forget_yaml(state_path)
+            self._ensure_dirs()
             with open(state_path, "w") as f:
-                yaml.dump(state, f, default_flow_style=False)
-            self.logger.debug(f"Saved state to {state_path}")
-            return True
+                json.dump(state, f, separators=(",", ":"))
+            self.logger.debug("Saved state to %s", state_path)
         except Exception as e:
             return self._handle_error("Error saving state file", e)
 
+        # The JSON file supersedes any state.yml left by an older version
+        try:
+            os.remove(self.legacy_state_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.debug("Could not remove legacy state file: %s", e)
+        return True
+
     def delete_profile(self):
         """Delete this profile's configuration and cache directories."""
+        import shutil
+
         if self._is_server_running():
             print(
                 "Cannot delete profile while server is running. Stop the server first."
@@ -291,15 +630,13 @@ class TailscaleProxyManager:
             return False
 
         try:
-            # Remove config directory
-            if os.path.exists(self.config_dir):
-                shutil.rmtree(self.config_dir)
-                print(f"Removed config directory: {self.config_dir}")
-
-            # Remove cache directory
-            if os.path.exists(self.cache_dir):
-                shutil.rmtree(self.cache_dir)
-                print(f"Removed cache directory: {self.cache_dir}")
+            # Remove the config and cache directories, skipping any that don't exist
+            for label, path in (("config", self.config_dir), ("cache", self.cache_dir)):
+                try:
+                    shutil.rmtree(path)
+                except FileNotFoundError:
+                    continue
+                print(f"Removed {label} directory: {path}")
 
             return True
         except Exception as e:
@@ -308,8 +645,7 @@ class TailscaleProxyManager:
     def start_server(self):
         """Start the tailscaled process with custom state directory and socket"""
         if self._is_server_running():
-            self.logger.info("Tailscaled is already running")
-            print("Tailscaled is already running")
+            self._announce("Tailscaled is already running")
             return True
 
         # Check and update port if needed
@@ -317,7 +653,10 @@ class TailscaleProxyManager:
             return False
 
         # Start the server process
-        if not self._start_tailscaled_process():
+        started = self._start_tailscaled_process()
+        self._running_cache = None
+        self._invalidate_cached_status()
+        if not started:
             return False
 
         # Save the runtime state
@@ -325,18 +664,14 @@ class TailscaleProxyManager:
 
         # Only try to access pid if tailscaled_process is not None
         if self.tailscaled_process:
-            self.logger.info(
-                f"Tailscaled started with PID {self.tailscaled_process.pid}"
-            )
-            print(f"Tailscaled started with PID {self.tailscaled_process.pid}")
+            self._announce(f"Tailscaled started with PID {self.tailscaled_process.pid}")
         else:
-            self.logger.info("Tailscaled started successfully")
-            print("Tailscaled started successfully")
+            self._announce("Tailscaled started successfully")
 
-        self.logger.info(
+        self._announce(
             f"SOCKS5 proxy will be available at {self.bind_address}:{self.port}"
         )
-        print(f"SOCKS5 proxy will be available at {self.bind_address}:{self.port}")
+        self._refresh_cached_status()
         return True
 
     def _ensure_available_port(self):
@@ -346,22 +681,25 @@ class TailscaleProxyManager:
             if self._is_port_in_use(self.port):
                 original_port = self.port
                 self.logger.debug(
-                    f"Configured port {original_port} is in use, searching for available port"
+                    "Configured port %s is in use, searching for available port",
+                    original_port,
                 )
-                while self._is_port_in_use(self.port):
-                    self.port += 1  # Increment the port number
-                    if self.port > original_port + 100:  # Limit search to 100 ports
-                        error_msg = f"Error: Configured port {original_port} in bind address {self.bind_address}:{original_port} is already in use."
-                        self.logger.error(error_msg)
-                        print(error_msg)
-                        print("Please modify your config.yaml to use a different port.")
-                        return False
+                # One read of /proc/net/tcp rules out the ports that already have
+                # a listener, so only the remaining candidates need a bind probe
+                listening = _listening_tcp_ports(*self._bind_host_family())
+                for port in range(original_port + 1, original_port + 101):
+                    if port not in listening and not self._is_port_in_use(port):
+                        self.port = port
+                        break
+                else:  # Limit search to 100 ports
+                    self._handle_error(
+                        f"Error: Configured port {original_port} in bind address {self.bind_address}:{original_port} is already in use."
+                    )
+                    print("Please modify your config.yaml to use a different port.")
+                    return False
 
                 # Update the bind config with the new port
-                self.logger.info(
-                    f"Port {original_port} is already in use, using port {self.port} instead"
-                )
-                print(
+                self._announce(
                     f"Port {original_port} is already in use, using port {self.port} instead"
                 )
                 # Update the state to reflect the new port
@@ -369,85 +707,113 @@ class TailscaleProxyManager:
                 # Also update the bind string in the state
                 self.state["bind"] = f"{self.bind_address}:{self.port}"
         else:
-            # If bind is not configured, start with default and find an available port
-            while self._is_port_in_use(self.port):
+            # If bind is not configured, use the default port or let the kernel pick one
+            if self._is_port_in_use(self.port):
+                original_port = self.port
+                self.port = self._pick_ephemeral_port()
                 self.logger.debug(
-                    f"Port {self.port} is already in use, trying port {self.port + 1}"
-                )
-                print(
-                    f"Port {self.port} is already in use, trying port {self.port + 1}"
+                    "Port %s is already in use, using port %s", original_port, self.port
                 )
-                self.port += 1
-            self.logger.info(f"Using bind address: {self.bind_address}:{self.port}")
-            print(f"Using bind address: {self.bind_address}:{self.port}")
+                print(f"Port {original_port} is already in use, using port {self.port}")
+            self._announce(f"Using bind address: {self.bind_address}:{self.port}")
 
         return True
 
+    def _pick_ephemeral_port(self):
+        """Ask the kernel for a free port instead of probing ports one by one"""
+        host, family = self._bind_host_family()
+        with socket.socket(family, socket.SOCK_STREAM) as s:
+            s.bind((host, 0))
+            return s.getsockname()[1]
+
     def _start_tailscaled_process(self):
         """Start the tailscaled process"""
-        # Create a state file path instead of just using the directory
-        state_file = os.path.join(self.state_dir, "tailscale.state")
-
         cmd = [
             self.tailscaled_path,
             "--state",
-            state_file,
+            self.state_file,
             "--socket",
             self.socket_path,
             "--socks5-server",
             f"{self.bind_address}:{self.port}",
             "--tun=userspace-networking",
+            # Any additional tailscaled args from config
+            *self.config.get("tailscaled_args", ()),
         ]
 
-        # Add any additional tailscaled args from config
-        if "tailscaled_args" in self.config:
-            cmd.extend(self.config["tailscaled_args"])
-
-        self.logger.info(f"Starting tailscaled with command: {' '.join(cmd)}")
-        print(f"Starting tailscaled with command: {' '.join(cmd)}")
+        self._announce(f"Starting tailscaled with command: {' '.join(cmd)}")
 
-        # Start tailscaled as a background process
-        self.tailscaled_process = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
+        # Start tailscaled as a background process in its own session. Its output
+        # goes to a log file because nobody reads a pipe once the CLI exits, and
+        # a full or closed pipe would block or kill the daemon. The log is
+        # truncated on each start so it only ever holds the current run
+        self._ensure_dirs()
+        log_path = os.path.join(self.cache_dir, "tailscaled.log")
+        with open(log_path, "wb") as log_file:
+            self.tailscaled_process = subprocess.Popen(
+                cmd,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
 
-        # Wait a moment for the process to start
-        time.sleep(2)
+        # Wait until tailscaled has created its socket, exits, or the deadline passes
+        self._wait_for_socket()
 
         if self.tailscaled_process.poll() is not None:
-            stdout, stderr = self.tailscaled_process.communicate()
-            error_msg = f"Failed to start tailscaled: {stderr}"
-            self.logger.error(error_msg)
-            print(error_msg)
-            return False
+            output = self._read_log_tail(log_path)
+            return self._handle_error(f"Failed to start tailscaled: {output}")
 
         self.logger.debug("Tailscaled process started successfully")
         return True
 
+    def _read_log_tail(self, log_path, max_bytes=4096):
+        """Return the last max_bytes of log_path"""
+        try:
+            with open(log_path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - max_bytes))
+                return f.read().decode(errors="replace").strip()
+        except OSError as e:
+            self.logger.debug("Could not read %s: %s", log_path, e)
+            return ""
+
+    def _wait_for_socket(self, timeout=5.0, interval=0.025):
+        """Wait for the tailscaled socket to accept connections, returning early if the process exits"""
+        for _ in range(int(timeout / interval)):
+            # A leftover socket file from a previous run exists but refuses connections
+            if os.path.exists(self.socket_path) and _unix_socket_accepting(
+                self.socket_path
+            ):
+                return True
+            try:
+                # Doubles as the poll interval and returns as soon as the process dies
+                self.tailscaled_process.wait(timeout=interval)
+                return False
+            except subprocess.TimeoutExpired:
+                pass
+        return False
+
     def start_session(self, auth_token=None):
         """Start a tailscale session, authenticate, and bring up the network"""
         if not self._is_server_running():
             print("Tailscaled is not running. Please start the server first.")
             return False
 
-        # Build the up command
-        cmd = [self.tailscale_path, "--socket", self.socket_path, "up"]
-
-        # Add accept routes and other options from config
-        if self.config.get("accept_routes", True):
-            cmd.append("--accept-routes")
-
-        if self.config.get("accept_dns", True):
-            cmd.append("--accept-dns")
-
-        # Add any additional tailscale up args from config
-        if "tailscale_up_args" in self.config:
-            cmd.extend(self.config["tailscale_up_args"])
-
-        # Add auth token with precedence: command line > environment > config
+        # Auth token precedence: command line > environment > config
         token_to_use = auth_token or self.auth_token
-        if token_to_use:
-            cmd.extend(["--authkey", token_to_use])
+
+        # Build the up command in one go from the config options
+        cmd = [
+            self.tailscale_path,
+            "--socket",
+            self.socket_path,
+            "up",
+            *(("--accept-routes",) if self.config.get("accept_routes", True) else ()),
+            *(("--accept-dns",) if self.config.get("accept_dns", True) else ()),
+            *self.config.get("tailscale_up_args", ()),
+            *(("--authkey", token_to_use) if token_to_use else ()),
+        ]
 
         print(f"Starting tailscale session with command: {' '.join(cmd)}")
 
@@ -455,6 +821,7 @@ class TailscaleProxyManager:
         process = subprocess.run(
             cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
         )
+        self._invalidate_cached_status()
 
         if process.returncode != 0:
             print(f"Failed to start tailscale session: {process.stderr}")
@@ -478,9 +845,11 @@ class TailscaleProxyManager:
 
         print(f"Stopping tailscale session with command: {' '.join(cmd)}")
 
+        # Only stderr is reported, so don't buffer stdout through a pipe
         process = subprocess.run(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
         )
+        self._invalidate_cached_status()
 
         if process.returncode != 0:
             print(f"Failed to stop tailscale session: {process.stderr}")
@@ -501,18 +870,21 @@ class TailscaleProxyManager:
         if pid:
             try:
                 os.kill(pid, signal.SIGTERM)
+                self._running_cache = None
+                self._invalidate_cached_status()
                 print(f"Sent SIGTERM to tailscaled process {pid}")
 
                 # Wait for process to terminate
-                for _ in range(5):
-                    if not self._is_server_running():
-                        print("Tailscaled stopped successfully")
-                        return True
-                    time.sleep(1)
+                if self._wait_for_exit(pid):
+                    print("Tailscaled stopped successfully")
+                    self._refresh_cached_status()
+                    return True
 
-                # Force kill if still running
+                # Force kill if still running, and reap it if it is our child
                 os.kill(pid, signal.SIGKILL)
                 print(f"Sent SIGKILL to tailscaled process {pid}")
+                self._wait_for_exit(pid, timeout=1.0)
+                self._refresh_cached_status()
                 return True
             except ProcessLookupError:
                 print(f"Process {pid} not found")
@@ -522,9 +894,64 @@ class TailscaleProxyManager:
         print("Could not find or stop tailscaled process")
         return False
 
+    def _wait_for_exit(self, pid, timeout=5.0, interval=0.05):
+        """Wait for a process to exit, returning True if it did within the timeout"""
+        # If we spawned the process ourselves we can block on it directly
+        if self.tailscaled_process and self.tailscaled_process.pid == pid:
+            try:
+                self.tailscaled_process.wait(timeout=timeout)
+                return True
+            except subprocess.TimeoutExpired:
+                return False
+
+        # On Linux a pidfd becomes readable the moment the process exits
+        exited = self._wait_for_pidfd(pid, timeout)
+        if exited is not None:
+            return exited
+
+        # Otherwise poll with signal 0, which only checks that the PID exists
+        for _ in range(int(timeout / interval)):
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return True
+            except PermissionError:
+                pass
+            time.sleep(interval)
+
+        return False
+
+    def _wait_for_pidfd(self, pid, timeout):
+        """Wait for exit via pidfd_open, returning None if pidfds are unavailable"""
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is None:
+            return None
+
+        try:
+            fd = pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError as e:
+            # e.g. ENOSYS on kernels older than 5.3
+            self.logger.debug("pidfd_open unavailable: %s", e)
+            return None
+
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            return bool(poller.poll(int(timeout * 1000)))
+        finally:
+            os.close(fd)
+
     def get_status(self) -> Dict[str, Any]:
         """Get the status of this profile"""
-        server_running = self._is_server_running()
+        cached = self._load_cached_status()
+        if cached is not None:
+            return cached
+        return self._probe_status()
+
+    def _probe_status(self) -> Dict[str, Any]:
+        """Get the status of this profile from tailscaled itself"""
         session_up = False
         ip_address = "N/A"
 
@@ -535,38 +962,25 @@ class TailscaleProxyManager:
         bind_address = state.get("bind_address", self.bind_address)
         port = state.get("port", self.port)
 
-        if server_running:
-            # Check if the session is up
-            cmd = [
-                self.tailscale_path,
-                "--socket",
-                self.socket_path,
-                "status",
-                "--json",
-            ]
-
-            try:
-                process = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=2,
-                )
-
-                if process.returncode == 0:
-                    status_data = json.loads(process.stdout)
-                    session_up = status_data.get("BackendState", "") == "Running"
-
-                    # Try to get the IP address
-                    if (
-                        "Self" in status_data
-                        and "TailscaleIPs" in status_data["Self"]
-                        and status_data["Self"]["TailscaleIPs"]
-                    ):
-                        ip_address = status_data["Self"]["TailscaleIPs"][0]
-            except Exception as e:
-                print(f"Error getting session status: {e}")
+        # A successful `status --json` doubles as the liveness probe, so the
+        # separate _is_server_running check is only needed when it fails
+        status_data = None
+        if os.path.exists(self.socket_path):
+            status_data = self._query_status_json()
+        server_running = status_data is not None or self._is_server_running()
+
+        if status_data is not None:
+            # Later liveness checks in this command can reuse this answer
+            self._running_cache = (time.monotonic(), True)
+            session_up = status_data.get("BackendState", "") == "Running"
+
+            # Try to get the IP address
+            if (
+                "Self" in status_data
+                and "TailscaleIPs" in status_data["Self"]
+                and status_data["Self"]["TailscaleIPs"]
+            ):
+                ip_address = status_data["Self"]["TailscaleIPs"][0]
 
         # Combine runtime state with process status
         status = {
@@ -586,94 +1000,188 @@ class TailscaleProxyManager:
 
         return status
 
+    def _load_cached_status(self):
+        """Load the status snapshot if it was written recently, otherwise None"""
+        try:
+            status = _read_status_snapshot(self.cache_dir)
+        except (OSError, ValueError) as e:
+            self.logger.debug("Ignoring unreadable status cache: %s", e)
+            return None
+        if status is not None:
+            self.logger.debug("Using cached status from %s", self.cache_dir)
+        return status
+
+    def _refresh_cached_status(self):
+        """Snapshot the status after start_server or stop_server changes it"""
+        self._running_cache = None
+        self._save_cached_status(self._probe_status())
+
+    def _save_cached_status(self, status):
+        """Save a status snapshot for get_status calls in the next few seconds"""
+        import json
+
+        # Readers in other processes must never see a half-written file, so
+        # write it aside and rename it into place
+        status_path = os.path.join(self.cache_dir, "status.json")
+        tmp_path = f"{status_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"socket_path": self.socket_path, "status": status}, f)
+            os.replace(tmp_path, status_path)
+        except OSError as e:
+            self.logger.debug("Could not write status cache: %s", e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _invalidate_cached_status(self):
+        """Discard the status snapshot after the server or session state changes"""
+        try:
+            os.remove(os.path.join(self.cache_dir, "status.json"))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.debug("Could not remove status cache: %s", e)
+
+    def _query_status_json(self):
+        """Get tailscaled's status as a dict, or None on failure"""
+        import json
+
+        # The LocalAPI serves the same payload as `tailscale status --json`
+        # without forking the tailscale binary
+        try:
+            return json.loads(
+                _localapi_get(self.socket_path, "/localapi/v0/status", timeout=2)
+            )
+        except (ConnectionRefusedError, FileNotFoundError) as e:
+            # Nothing is listening, so unless tailscaled is still starting up this
+            # is a stale socket that the CLI can't talk to either
+            if not self._find_tailscaled_pid():
+                self.logger.debug("Skipping status query on stale socket: %s", e)
+                self._running_cache = (time.monotonic(), False)
+                return None
+            self.logger.debug("LocalAPI status request failed, using the CLI: %s", e)
+        except Exception as e:
+            self.logger.debug("LocalAPI status request failed, using the CLI: %s", e)
+
+        cmd = [
+            self.tailscale_path,
+            "--socket",
+            self.socket_path,
+            "status",
+            "--json",
+        ]
+
+        try:
+            # stderr is never looked at here, so don't collect it through a pipe.
+            # json.loads takes the raw bytes, so skip decoding them to str first
+            process = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=2,
+            )
+
+            if process.returncode == 0:
+                return json.loads(process.stdout)
+        except Exception as e:
+            print(f"Error getting session status: {e}")
+
+        return None
+
     def _is_server_running(self):
+        """Check if tailscaled is running, reusing a very recent result if there is one"""
+        if self._running_cache is not None:
+            checked_at, running = self._running_cache
+            if time.monotonic() - checked_at < _RUNNING_CACHE_TTL:
+                return running
+
+        running = self._check_server_running()
+        self._running_cache = (time.monotonic(), running)
+        return running
+
+    def _check_server_running(self):
         """Check if tailscaled is running by checking the socket file and process existence"""
         # First check if the socket file exists
         if not os.path.exists(self.socket_path):
-            self.logger.debug(f"Socket file does not exist: {self.socket_path}")
+            self.logger.debug("Socket file does not exist: %s", self.socket_path)
             return False
 
-        # Try to find the process ID
+        # A daemon accepting connections on its socket is running, and a connect()
+        # is far cheaper than spawning `tailscale status` to find that out
+        if _unix_socket_accepting(self.socket_path, timeout=0.2):
+            self.logger.debug("Server is running (socket accepted a connection)")
+            return True
+
+        # The socket may not be accepting yet while the daemon is starting up
         pid = self._find_tailscaled_pid()
         if pid:
             # If we found a PID, the server is running
-            self.logger.debug(f"Found tailscaled process with PID {pid}")
+            self.logger.debug("Found tailscaled process with PID %s", pid)
             return True
 
-        # As a fallback, try to use the socket to check status
-        cmd = [self.tailscale_path, "--socket", self.socket_path, "status"]
-        self.logger.debug(f"Checking server status with command: {' '.join(cmd)}")
-
-        try:
-            process = subprocess.run(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=5,  # Increase timeout from 2 to 5 seconds
-            )
-            if process.returncode == 0:
-                self.logger.debug(
-                    "Server is running (confirmed via socket status check)"
-                )
-                return True
-            else:
-                self.logger.debug(
-                    f"Socket status check failed with return code {process.returncode}"
-                )
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired) as e:
-            self.logger.debug(f"Socket status check failed: {str(e)}")
-            # If the socket check fails, check if we can find the process by looking for the command line
-            try:
-                # Look for a process with our socket path in its command line
-                system = platform.system()
-                if system in ["Linux", "Darwin"]:  # Linux or macOS
-                    cmd = ["pgrep", "-f", f"tailscaled.*{self.socket_path}"]
-                    self.logger.debug(f"Trying pgrep fallback: {' '.join(cmd)}")
-                    result = subprocess.run(cmd, stdout=subprocess.PIPE, text=True)
-                    if result.returncode == 0 and bool(result.stdout.strip()):
-                        self.logger.debug(
-                            "Server is running (confirmed via pgrep fallback)"
-                        )
-                        return True
-                    else:
-                        self.logger.debug("pgrep fallback found no matching process")
-            except subprocess.SubprocessError as e:
-                self.logger.debug(f"pgrep fallback failed: {str(e)}")
-                pass
-
         self.logger.debug("Server is not running")
         return False
 
+    def _bind_host_family(self):
+        """Return the host and address family tailscaled will listen on"""
+        host = self.bind_address.strip("[]")
+        if host in ("", "localhost"):
+            host = "127.0.0.1"
+        family = socket.AF_INET6 if ":" in host else socket.AF_INET
+        return host, family
+
     def _is_port_in_use(self, port):
         """Check if the given port is already in use"""
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            return s.connect_ex(("localhost", port)) == 0
+        # Binding is a purely local check, unlike connect_ex which has to
+        # complete a TCP handshake over loopback for every probed port. Probe
+        # the address tailscaled will bind so that e.g. 0.0.0.0 also catches
+        # listeners on other interfaces
+        host, family = self._bind_host_family()
+
+        with socket.socket(family, socket.SOCK_STREAM) as s:
+            if os.name == "posix":
+                # Like tailscaled's own listener, ignore connections in TIME_WAIT.
+                # On Windows the same option would allow binding over a listener
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                s.bind((host, port))
+                return False
+            except OSError as e:
+                return e.errno in (errno.EADDRINUSE, errno.EACCES)
 
     def _find_tailscaled_pid(self):
         """Try to find the PID of the tailscaled process"""
         system = platform.system()
 
-        if system in ["Linux", "Darwin"]:  # Linux or macOS
+        if system == "Linux" and os.path.isdir("/proc"):
+            # Reading /proc directly does what pgrep would, without the fork+exec
+            pid = self._find_tailscaled_pid_in_proc()
+            if pid:
+                self.logger.debug("Found tailscaled PID: %s", pid)
+                return pid
+        elif system in ["Linux", "Darwin"]:  # Linux without /proc, or macOS
             try:
                 cmd = ["pgrep", "-f", f"tailscaled.*{self.socket_path}"]
-                self.logger.debug(f"Running command to find PID: {' '.join(cmd)}")
+                self.logger.debug("Running command to find PID: %s", " ".join(cmd))
                 result = subprocess.run(cmd, stdout=subprocess.PIPE, text=True)
                 if result.returncode == 0 and result.stdout.strip():
                     # Parse the first PID from the output
                     pids = result.stdout.strip().split("\n")
                     if pids and pids[0].strip():
                         pid = int(pids[0].strip())
-                        self.logger.debug(f"Found tailscaled PID: {pid}")
+                        self.logger.debug("Found tailscaled PID: %s", pid)
                         return pid
             except (subprocess.SubprocessError, ValueError) as e:
-                self.logger.debug(f"Error finding tailscaled PID: {str(e)}")
+                self.logger.debug("Error finding tailscaled PID: %s", e)
                 pass
         else:  # Windows or other
             # This is a simplified approach for Windows
             try:
                 cmd = ["tasklist", "/FI", "IMAGENAME eq tailscaled.exe", "/FO", "CSV"]
                 self.logger.debug(
-                    f"Running Windows command to find PID: {' '.join(cmd)}"
+                    "Running Windows command to find PID: %s", " ".join(cmd)
                 )
                 result = subprocess.run(cmd, stdout=subprocess.PIPE, text=True)
                 if "tailscaled.exe" in result.stdout:
@@ -684,31 +1192,113 @@ class TailscaleProxyManager:
                     # A more sophisticated approach would be needed for Windows
                     pass
             except subprocess.SubprocessError as e:
-                self.logger.debug(f"Error finding tailscaled PID on Windows: {str(e)}")
+                self.logger.debug("Error finding tailscaled PID on Windows: %s", e)
                 pass
 
         self.logger.debug("No tailscaled PID found")
         return None
 
+    def _find_tailscaled_pid_in_proc(self, proc_dir="/proc"):
+        """Find the lowest tailscaled PID for our socket by reading /proc/*/cmdline"""
+        # Same match as `pgrep -f "tailscaled.*<socket_path>"`
+        target = os.fsencode(self.socket_path)
+
+        # The PID found last time is usually still ours, and checking it is one read
+        known = self._known_pid
+        if known is not None and _is_tailscaled_cmdline(
+            os.path.join(proc_dir, str(known), "cmdline"), target
+        ):
+            return known
+
+        own_pid = os.getpid()
+        found = None
+
+        try:
+            entries = os.scandir(proc_dir)
+        except OSError as e:
+            self.logger.debug("Could not scan %s: %s", proc_dir, e)
+            return None
+
+        with entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                pid = int(entry.name)
+                if pid == own_pid or (found is not None and pid > found):
+                    continue
+                if _is_tailscaled_cmdline(
+                    os.path.join(proc_dir, entry.name, "cmdline"), target
+                ):
+                    found = pid
+
+        self._known_pid = found
+        return found
+
 
 def get_all_profiles():
     """Get a list of all existing profiles"""
-    # Look in both config and cache directories
-    config_dirs = glob.glob(os.path.expanduser("~/.config/tailscale-*"))
-    cache_dirs = glob.glob(os.path.expanduser("~/.cache/tailscale-*"))
+    # Look in both config and cache directories, combining and deduplicating names
+    profile_names = list(_scan_profiles("~/.config") | _scan_profiles("~/.cache"))
+    if not profile_names:
+        return []
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Status checks block on subprocesses, so run them concurrently
+    with ThreadPoolExecutor(max_workers=min(32, len(profile_names))) as executor:
+        return list(executor.map(_get_profile_status, profile_names))
+
+
+def _scan_profiles(base):
+    """Return the profile names found as tailscale-* directories under base"""
+    prefix = "tailscale-"
+    try:
+        with os.scandir(os.path.expanduser(base)) as entries:
+            return {
+                entry.name.removeprefix(prefix)
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.is_dir()
+            }
+    except OSError:
+        # Missing, unreadable or not a directory: there are no profiles to list
+        return set()
+
+
+def _get_profile_status(profile_name):
+    """Get the status of a single profile by name"""
+    # A fresh snapshot is enough, so skip loading the profile's config and state
+    cache_dir = os.path.expanduser(f"~/.cache/tailscale-{profile_name}")
+    try:
+        status = _read_status_snapshot(cache_dir)
+    except (OSError, ValueError):
+        status = None
+    if status is not None:
+        return status
+    return TailscaleProxyManager(profile_name).get_status()
+
 
-    # Extract profile names from directory paths
-    config_profiles = [
-        os.path.basename(d).replace("tailscale-", "") for d in config_dirs
-    ]
-    cache_profiles = [os.path.basename(d).replace("tailscale-", "") for d in cache_dirs]
+def _read_status_snapshot(cache_dir):
+    """Return the status.json snapshot in cache_dir, or None if missing or stale"""
+    import json
 
-    # Combine and deduplicate profile names
-    profile_names = list(set(config_profiles + cache_profiles))
-    profiles = []
+    status_path = os.path.join(cache_dir, "status.json")
+    try:
+        if time.time() - os.stat(status_path).st_mtime > _STATUS_CACHE_TTL:
+            return None
+    except FileNotFoundError:
+        return None
+    with open(status_path, "rb") as f:
+        snapshot = json.load(f)
 
-    for profile_name in profile_names:
-        manager = TailscaleProxyManager(profile_name)
-        profiles.append(manager.get_status())
+    if not isinstance(snapshot, dict):
+        return None
+    status = snapshot.get("status")
+    socket_path = snapshot.get("socket_path")
+    if not isinstance(status, dict) or not isinstance(socket_path, str):
+        return None
 
-    return profiles
+    # tailscaled may have died (or been started) since the snapshot was taken,
+    # and a connect() on its socket is cheap enough to find out
+    if _unix_socket_accepting(socket_path) != bool(status.get("server_running")):
+        return None
+    return status
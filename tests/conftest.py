@@ -33,6 +33,8 @@ def mock_manager(mocker):
     manager.config_dir = temp_config_dir
     manager.cache_dir = temp_cache_dir
     manager.config_path = os.path.join(temp_config_dir, "config.yaml")
+    manager.state_path = os.path.join(temp_cache_dir, "state.json")
+    manager.legacy_state_path = os.path.join(temp_cache_dir, "state.yml")
 
     # Mock methods that would interact with the system
     mocker.patch.object(manager, "_is_server_running", return_value=False)
@@ -61,6 +63,10 @@ def mock_running_manager(mock_manager, mocker):
     mocker.patch.object(mock_manager, "_is_server_running", return_value=True)
     mocker.patch.object(mock_manager, "_find_tailscaled_pid", return_value=12345)
 
+    # Create the control socket path so status probes treat the daemon as reachable
+    mock_manager.socket_path = os.path.join(mock_manager.cache_dir, "tailscaled.sock")
+    open(mock_manager.socket_path, "w").close()
+
     # Mock the subprocess calls
     mock_process = MagicMock()
     mock_process.returncode = 0
@@ -78,6 +84,12 @@ def mock_running_manager(mock_manager, mocker):
     return mock_manager
 
 
+@pytest.fixture
+def mock_manager_class(mocker):
+    """Patch the manager class used by the CLI and return the mocked class."""
+    return mocker.patch("tailsocks.cli.TailscaleProxyManager")
+
+
 @pytest.fixture
 def mock_cli_args():
     """Create a mock for CLI arguments."""
@@ -1,8 +1,13 @@
 """Tests for the CLI functionality."""
 
+import argparse
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from tailsocks.cli import (
+    _build_parser,
+    _format_status,
     _handle_delete_profile,
     _handle_start_server,
     _handle_start_session,
@@ -16,6 +21,20 @@ from tailsocks.cli import (
 )
 
 
+def _make_args(**overrides):
+    """Build parsed CLI args with the defaults argparse would give."""
+    args = argparse.Namespace(
+        command=None,
+        profile=None,
+        version=False,
+        verbose=False,
+        bind=None,
+        auth_token=None,
+    )
+    vars(args).update(overrides)
+    return args
+
+
 class TestStatusDisplay:
     def test_print_status_with_header(self, capsys):
         """Test printing status information with header."""
@@ -40,32 +59,27 @@ class TestStatusDisplay:
         assert "Bind address: localhost:1080" in captured.out
         assert "IP address: 100.100.100.100" in captured.out
 
-    def test_print_status_with_partial_data(self, capsys):
-        """Test printing status with missing fields."""
+    def test_format_status_with_partial_data(self):
+        """Test formatting status with missing fields."""
         status = {
             "profile_name": "test_profile",
             "server_running": True,
             # Missing some fields
         }
 
-        _print_status(status)
-        captured = capsys.readouterr()
-
-        assert "test_profile" in captured.out
-        assert "Server running: Yes" in captured.out
+        assert _format_status(status) == [
+            "Profile: test_profile",
+            "  Server running: Yes",
+        ]
 
-    def test_print_status_without_header(self, capsys):
-        """Test printing status information without header."""
+    def test_format_status_without_header(self):
+        """Test formatting status information without header."""
         status = {
             "profile_name": "test_profile",
             "server_running": True,
         }
 
-        _print_status(status, show_header=False)
-
-        captured = capsys.readouterr()
-        assert "Profile: test_profile" not in captured.out
-        assert "Server running: Yes" in captured.out
+        assert _format_status(status, show_header=False) == ["  Server running: Yes"]
 
     def test_show_status_specific_profile(self, mock_cli_args, mocker):
         """Test showing status for a specific profile."""
@@ -74,11 +88,15 @@ class TestStatusDisplay:
         mock_manager = MagicMock()
         mock_manager.get_status.return_value = {"profile_name": "test_profile"}
 
-        with patch("tailsocks.cli.TailscaleProxyManager", return_value=mock_manager):
-            with patch("tailsocks.cli._print_status") as mock_print:
-                show_status(mock_cli_args)
+        mock_manager_class = mocker.patch(
+            "tailsocks.cli.TailscaleProxyManager", return_value=mock_manager
+        )
+        mock_print = mocker.patch("tailsocks.cli._print_status")
 
-                mock_print.assert_called_once_with({"profile_name": "test_profile"})
+        show_status(mock_cli_args)
+
+        mock_manager_class.assert_called_once_with("test_profile")
+        mock_print.assert_called_once_with({"profile_name": "test_profile"})
 
     def test_show_status_all_profiles(self, mock_cli_args, mocker, capsys):
         """Test showing status for all profiles."""
@@ -94,6 +112,29 @@ class TestStatusDisplay:
             assert "profile1" in captured.out
             assert "profile2" in captured.out
 
+    def test_show_status_all_profiles_single_write(self, mock_cli_args, mocker):
+        """Test that the profile listing is printed with a single call."""
+        mock_cli_args.profile = None
+
+        profiles = [
+            {"profile_name": "profile1", "server_running": True},
+            {"profile_name": "profile2", "server_running": False},
+        ]
+
+        mocker.patch("tailsocks.cli.get_all_profiles", return_value=profiles)
+        mock_print = mocker.patch("builtins.print")
+
+        show_status(mock_cli_args)
+
+        mock_print.assert_called_once_with(
+            "Found 2 profile(s):\n"
+            "Profile: profile1\n"
+            "  Server running: Yes\n"
+            "\n"
+            "Profile: profile2\n"
+            "  Server running: No\n"
+        )
+
     def test_show_status_no_profiles(self, mock_cli_args, mocker, capsys):
         """Test showing status when no profiles exist."""
         mock_cli_args.profile = None
@@ -162,19 +203,20 @@ class TestProfileSelection:
 
 
 class TestCommandHandlers:
-    def test_handle_start_server_with_bind(self, mock_manager, mock_cli_args):
+    def test_handle_start_server_with_bind(self, mock_manager, mock_cli_args, mocker):
         """Test handling the start-server command with bind address."""
         mock_cli_args.bind = "0.0.0.0:8080"
 
-        with patch.object(mock_manager, "update_bind_address") as mock_update:
-            with patch.object(
-                mock_manager, "start_server", return_value=True
-            ) as mock_start:
-                result = _handle_start_server(mock_manager, mock_cli_args)
+        mock_update = mocker.patch.object(mock_manager, "update_bind_address")
+        mock_start = mocker.patch.object(
+            mock_manager, "start_server", return_value=True
+        )
+
+        result = _handle_start_server(mock_manager, mock_cli_args)
 
-                assert result is True
-                mock_update.assert_called_once_with("0.0.0.0:8080")
-                mock_start.assert_called_once()
+        assert result is True
+        mock_update.assert_called_once_with("0.0.0.0:8080")
+        mock_start.assert_called_once()
 
     def test_handle_start_server_without_bind(self, mock_manager, mock_cli_args):
         """Test handling the start-server command without bind address."""
@@ -257,26 +299,42 @@ class TestCommandHandlers:
 
     def test_handle_delete_profile_success(self, mock_manager, mocker):
         """Test handling delete-profile command successfully."""
-        with patch.object(mock_manager, "_is_server_running", return_value=False):
-            with patch("os.path.exists", return_value=True):
-                with patch("shutil.rmtree") as mock_rmtree:
-                    # Make sure the paths contain the expected substrings
-                    mock_manager.config_dir = (
-                        "/home/user/.config/tailscale-test_profile"
-                    )
-                    mock_manager.cache_dir = "/home/user/.cache/tailscale-test_profile"
+        mocker.patch.object(mock_manager, "_is_server_running", return_value=False)
+        mocker.patch("os.path.exists", return_value=True)
+        mock_rmtree = mocker.patch("shutil.rmtree")
+
+        # Make sure the paths contain the expected substrings
+        mock_manager.config_dir = "/home/user/.config/tailscale-test_profile"
+        mock_manager.cache_dir = "/home/user/.cache/tailscale-test_profile"
+
+        result = _handle_delete_profile(mock_manager)
+
+        assert result is True
+        assert mock_rmtree.call_count == 2
+
+    def test_handle_delete_profile_config_dir_only(self, mock_manager, mocker, capsys):
+        """Test that a profile with only a config directory can still be deleted."""
+        mocker.patch.object(mock_manager, "_is_server_running", return_value=False)
+        mocker.patch(
+            "os.path.exists",
+            side_effect=lambda path: path == mock_manager.config_dir,
+        )
+        mock_rmtree = mocker.patch("shutil.rmtree")
+
+        mock_manager.config_dir = "/home/user/.config/tailscale-test_profile"
+        mock_manager.cache_dir = "/home/user/.cache/tailscale-test_profile"
 
-                    result = _handle_delete_profile(mock_manager)
+        result = _handle_delete_profile(mock_manager)
 
-                    assert result is True
-                    assert mock_rmtree.call_count == 2
+        assert result is True
+        mock_rmtree.assert_any_call(mock_manager.config_dir, ignore_errors=True)
+        assert "Profile 'test_profile' has been deleted." in capsys.readouterr().out
 
 
 class TestCommandDispatch:
     def test_handle_command_status(self, mocker):
         """Test handling the status command."""
-        args = MagicMock()
-        args.command = "status"
+        args = _make_args(command="status")
 
         with patch("tailsocks.cli.show_status") as mock_show:
             result = handle_command(args)
@@ -284,54 +342,41 @@ class TestCommandDispatch:
             assert result == 0
             mock_show.assert_called_once_with(args)
 
-    def test_handle_command_with_profile_selection(self, mocker):
+    def test_handle_command_with_profile_selection(self, mock_manager_class, mocker):
         """Test handling commands that require profile selection."""
-        args = MagicMock()
-        args.command = "start-server"
-        args.profile = None
+        args = _make_args(command="start-server")
 
         # Mock _require_profile_selection to return a profile
-        with patch(
+        mocker.patch(
             "tailsocks.cli._require_profile_selection", return_value="selected_profile"
-        ):
-            with patch("tailsocks.cli.TailscaleProxyManager") as mock_manager_class:
-                mock_manager = MagicMock()
-                mock_manager_class.return_value = mock_manager
+        )
+        mock_handler = mocker.patch(
+            "tailsocks.cli._handle_start_server", return_value=True
+        )
 
-                with patch(
-                    "tailsocks.cli._handle_start_server", return_value=True
-                ) as mock_handler:
-                    result = handle_command(args)
+        result = handle_command(args)
 
-                    assert result == 0
-                    assert args.profile == "selected_profile"
-                    mock_manager_class.assert_called_once_with("selected_profile")
-                    mock_handler.assert_called_once_with(mock_manager, args)
+        assert result == 0
+        assert args.profile == "selected_profile"
+        mock_manager_class.assert_called_once_with("selected_profile")
+        mock_handler.assert_called_once_with(mock_manager_class.return_value, args)
 
-    def test_handle_command_with_verbose_flag(self, mocker):
+    def test_handle_command_with_verbose_flag(self, mock_manager_class, mocker):
         """Test handling commands with verbose flag set."""
-        args = MagicMock()
-        args.command = "start-server"
-        args.verbose = True
-        args.profile = "test_profile"
+        args = _make_args(command="start-server", verbose=True, profile="test_profile")
 
-        with patch("tailsocks.cli.TailscaleProxyManager") as mock_manager_class:
-            mock_manager = MagicMock()
-            mock_manager_class.return_value = mock_manager
+        mock_handler = mocker.patch(
+            "tailsocks.cli._handle_start_server", return_value=True
+        )
 
-            with patch(
-                "tailsocks.cli._handle_start_server", return_value=True
-            ) as mock_handler:
-                result = handle_command(args)
+        result = handle_command(args)
 
-                assert result == 0
-                mock_handler.assert_called_once_with(mock_manager, args)
+        assert result == 0
+        mock_handler.assert_called_once_with(mock_manager_class.return_value, args)
 
     def test_handle_command_with_failed_profile_selection(self, mocker):
         """Test handling commands when profile selection fails."""
-        args = MagicMock()
-        args.command = "start-server"
-        args.profile = None
+        args = _make_args(command="start-server")
 
         # Mock _require_profile_selection to return None (failure)
         with patch("tailsocks.cli._require_profile_selection", return_value=None):
@@ -339,101 +384,36 @@ class TestCommandDispatch:
 
             assert result == 1
 
-    def test_handle_command_start_server(self, mocker):
-        """Test handling the start-server command."""
-        args = MagicMock()
-        args.command = "start-server"
-        args.profile = "test_profile"
-
-        with patch("tailsocks.cli.TailscaleProxyManager") as mock_manager_class:
-            mock_manager = MagicMock()
-            mock_manager_class.return_value = mock_manager
-
-            with patch(
-                "tailsocks.cli._handle_start_server", return_value=True
-            ) as mock_handler:
-                result = handle_command(args)
-
-                assert result == 0
-                mock_handler.assert_called_once_with(mock_manager, args)
-
-    def test_handle_command_start_session(self, mocker):
-        """Test handling the start-session command."""
-        args = MagicMock()
-        args.command = "start-session"
-        args.profile = "test_profile"
-
-        with patch("tailsocks.cli.TailscaleProxyManager") as mock_manager_class:
-            mock_manager = MagicMock()
-            mock_manager_class.return_value = mock_manager
-
-            with patch(
-                "tailsocks.cli._handle_start_session", return_value=True
-            ) as mock_handler:
-                result = handle_command(args)
-
-                assert result == 0
-                mock_handler.assert_called_once_with(mock_manager, args)
-
-    def test_handle_command_stop_session(self, mocker):
-        """Test handling the stop-session command."""
-        args = MagicMock()
-        args.command = "stop-session"
-        args.profile = "test_profile"
-
-        with patch("tailsocks.cli.TailscaleProxyManager") as mock_manager_class:
-            mock_manager = MagicMock()
-            mock_manager_class.return_value = mock_manager
-
-            with patch(
-                "tailsocks.cli._handle_stop_session", return_value=True
-            ) as mock_handler:
-                result = handle_command(args)
-
-                assert result == 0
-                mock_handler.assert_called_once_with(mock_manager)
-
-    def test_handle_command_stop_server(self, mocker):
-        """Test handling the stop-server command."""
-        args = MagicMock()
-        args.command = "stop-server"
-        args.profile = "test_profile"
-
-        with patch("tailsocks.cli.TailscaleProxyManager") as mock_manager_class:
-            mock_manager = MagicMock()
-            mock_manager_class.return_value = mock_manager
-
-            with patch(
-                "tailsocks.cli._handle_stop_server", return_value=True
-            ) as mock_handler:
-                result = handle_command(args)
-
-                assert result == 0
-                mock_handler.assert_called_once_with(mock_manager)
-
-    def test_handle_command_delete_profile(self, mocker):
-        """Test handling the delete-profile command."""
-        args = MagicMock()
-        args.command = "delete-profile"
-        args.profile = "test_profile"
-
-        with patch("tailsocks.cli.TailscaleProxyManager") as mock_manager_class:
-            mock_manager = MagicMock()
-            mock_manager_class.return_value = mock_manager
-
-            with patch(
-                "tailsocks.cli._handle_delete_profile", return_value=True
-            ) as mock_handler:
-                result = handle_command(args)
-
-                assert result == 0
-                mock_handler.assert_called_once_with(mock_manager)
+    @pytest.mark.parametrize(
+        "command,handler,takes_args",
+        [
+            ("start-server", "_handle_start_server", True),
+            ("start-session", "_handle_start_session", True),
+            ("stop-session", "_handle_stop_session", False),
+            ("stop-server", "_handle_stop_server", False),
+            ("delete-profile", "_handle_delete_profile", False),
+        ],
+    )
+    def test_handle_command_dispatch(
+        self, command, handler, takes_args, mock_manager_class, mocker
+    ):
+        """Test that each profile command is dispatched to its handler."""
+        args = _make_args(command=command, profile="test_profile")
+
+        mock_handler = mocker.patch(f"tailsocks.cli.{handler}", return_value=True)
+
+        result = handle_command(args)
+
+        assert result == 0
+        manager = mock_manager_class.return_value
+        if takes_args:
+            mock_handler.assert_called_once_with(manager, args)
+        else:
+            mock_handler.assert_called_once_with(manager)
 
     def test_handle_command_unknown(self, mocker):
         """Test handling an unknown command."""
-        args = MagicMock()
-        args.command = "unknown-command"
-        args.profile = "test_profile"
+        args = _make_args(command="unknown-command", profile="test_profile")
 
         result = handle_command(args)
 
@@ -444,9 +424,7 @@ class TestMainFunction:
     def test_main_version(self, mocker, capsys):
         """Test main function with --version flag."""
         # Mock parse_args to return args with version=True
-        args = MagicMock()
-        args.version = True
-        args.command = None
+        args = _make_args(version=True)
         mocker.patch("argparse.ArgumentParser.parse_args", return_value=args)
 
         # Mock __version__
@@ -461,10 +439,7 @@ class TestMainFunction:
     def test_cli_verbose_mode(self, mocker):
         """Test CLI with verbose mode enabled."""
         # Mock parse_args to return args with verbose=True
-        args = MagicMock()
-        args.version = False
-        args.command = "status"
-        args.verbose = True
+        args = _make_args(command="status", verbose=True)
         mocker.patch("argparse.ArgumentParser.parse_args", return_value=args)
 
         # Mock handle_command
@@ -481,9 +456,7 @@ class TestMainFunction:
     def test_main_no_command(self, mocker):
         """Test main function with no command."""
         # Mock parse_args to return args with no command
-        args = MagicMock()
-        args.version = False
-        args.command = None
+        args = _make_args()
         mocker.patch("argparse.ArgumentParser.parse_args", return_value=args)
 
         with patch("argparse.ArgumentParser.print_help") as mock_help:
@@ -495,9 +468,7 @@ class TestMainFunction:
     def test_main_with_command(self, mocker):
         """Test main function with a command."""
         # Mock parse_args to return args with a command
-        args = MagicMock()
-        args.version = False
-        args.command = "status"
+        args = _make_args(command="status")
         mocker.patch("argparse.ArgumentParser.parse_args", return_value=args)
 
         with patch("tailsocks.cli.handle_command", return_value=0) as mock_handle:
@@ -509,10 +480,7 @@ class TestMainFunction:
     def test_main_with_invalid_command(self, mocker):
         """Test main function with an invalid command."""
         # Mock parse_args to return args with an invalid command
-        args = MagicMock()
-        args.version = False
-        args.command = "invalid-command"
-        args.profile = "test_profile"
+        args = _make_args(command="invalid-command", profile="test_profile")
         mocker.patch("argparse.ArgumentParser.parse_args", return_value=args)
 
         with patch("tailsocks.cli.handle_command", return_value=1) as mock_handle:
@@ -520,3 +488,43 @@ class TestMainFunction:
 
             assert result == 1
             mock_handle.assert_called_once_with(args)
+
+    def test_main_fast_path_skips_parser(self, mocker):
+        """Test that a bare option-less command doesn't build the parser."""
+        mocker.patch("sys.argv", ["tailsocks", "stop-server"])
+        mock_build = mocker.patch("tailsocks.cli._build_parser")
+        mock_handle = mocker.patch("tailsocks.cli.handle_command", return_value=0)
+
+        result = main()
+
+        assert result == 0
+        mock_build.assert_not_called()
+        args = mock_handle.call_args[0][0]
+        assert args.command == "stop-server"
+        assert args.profile is None
+
+    def test_main_with_options_uses_parser(self, mocker):
+        """Test that commands with options still go through argparse."""
+        mocker.patch("sys.argv", ["tailsocks", "--profile", "p1", "stop-server"])
+        mock_handle = mocker.patch("tailsocks.cli.handle_command", return_value=0)
+
+        result = main()
+
+        assert result == 0
+        args = mock_handle.call_args[0][0]
+        assert args.command == "stop-server"
+        assert args.profile == "p1"
+
+    def test_build_parser_is_reused(self, mocker):
+        """Test that the parser is built once and reused across calls."""
+        mocker.patch("sys.argv", ["tailsocks", "--profile", "p1", "stop-server"])
+        mocker.patch("tailsocks.cli.handle_command", return_value=0)
+
+        assert _build_parser() is _build_parser()
+
+        # Parsing twice with the shared parser doesn't leak state between calls
+        assert main() == 0
+        mocker.patch("sys.argv", ["tailsocks", "start-server", "--bind", "2020"])
+        args = _build_parser().parse_args()
+        assert args.profile is None
+        assert args.bind == "2020"
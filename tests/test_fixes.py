@@ -2,6 +2,8 @@
 Test fixes for failing tests in the tailsocks package.
 """
 
+from tailsocks.manager import TailscaleProxyManager
+
 
 def test_is_server_running_with_socket_and_pid(mock_manager, mocker):
     """Test checking if server is running when socket exists and PID is found."""
@@ -43,8 +45,6 @@ def test_ensure_available_port_configured_port_in_use(mock_manager, mocker, caps
     original_method = mock_manager._ensure_available_port
 
     # Instead of trying to delete the attribute, we'll use the original implementation
-    from tailsocks.manager import TailscaleProxyManager
-
     mock_manager._ensure_available_port = (
         TailscaleProxyManager._ensure_available_port.__get__(mock_manager)
     )
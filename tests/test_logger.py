@@ -60,3 +60,14 @@ def test_setup_logger_existing_handlers():
     # Should not add another handler
     assert len(logger.handlers) == 1
     assert logger.handlers[0] == handler
+
+
+def test_setup_logger_reuses_configured_logger():
+    """Test that setting up the same logger again doesn't reconfigure it."""
+    logger = setup_logger("test_reused_logger", logging.WARNING)
+
+    with patch.object(logging.Logger, "setLevel") as mock_set_level:
+        assert setup_logger("test_reused_logger", logging.WARNING) is logger
+
+    mock_set_level.assert_not_called()
+    assert len(logger.handlers) == 1
@@ -1,13 +1,30 @@
 """Tests for the TailscaleProxyManager class."""
 
+import errno
+import json
 import os
 import shutil
+import signal
+import socket
+import socketserver
 import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler
 from unittest.mock import MagicMock
 
+import pytest
 import yaml
 
-from tailsocks.manager import TailscaleProxyManager, get_all_profiles
+from tailsocks.manager import (
+    _ADJECTIVES,
+    _ANIMALS,
+    _YAML_CACHE,
+    TailscaleProxyManager,
+    _listening_tcp_ports,
+    _read_status_snapshot,
+    _scan_profiles,
+    get_all_profiles,
+)
 
 
 class TestManagerInitialization:
@@ -19,10 +36,33 @@ class TestManagerInitialization:
         assert "tailscale-test_profile" in manager.config_dir
         assert "tailscale-test_profile" in manager.cache_dir
 
+    def test_init_leaves_filesystem_untouched(self):
+        """Test that building a manager doesn't create profile directories."""
+        manager = TailscaleProxyManager("test_readonly_profile")
+
+        assert not os.path.exists(manager.config_dir)
+        assert not os.path.exists(manager.cache_dir)
+        assert manager.get_status()["server_running"] is False
+        assert not os.path.exists(manager.cache_dir)
+
+        # Directories are created on the first write
+        assert manager._save_state() is True
+        assert os.path.isdir(manager.config_dir)
+        assert os.path.isdir(manager.cache_dir)
+
+    def test_ensure_dirs_skips_existing(self, mock_manager, mocker):
+        """Test that existing profile directories aren't created again."""
+        mock_makedirs = mocker.patch("os.makedirs")
+
+        mock_manager._ensure_dirs()
+
+        mock_makedirs.assert_not_called()
+        assert mock_manager._dirs_ensured is True
+
     def test_random_profile_name(self, mocker):
         """Test initialization with a random profile name."""
-        # Mock glob to return no existing profiles
-        mocker.patch("glob.glob", return_value=[])
+        # Mock the directory scan to return no existing profiles
+        mocker.patch("tailsocks.manager._scan_profiles", return_value=set())
 
         manager = TailscaleProxyManager()
         assert manager.profile_name is not None
@@ -35,12 +75,9 @@ class TestManagerInitialization:
 
     def test_generate_random_profile_name_with_existing_profiles(self, mocker):
         """Test random profile name generation with existing profiles."""
-        # Mock glob to return existing profiles
-        existing_profiles = [
-            "/home/user/.config/tailscale-happy_gorilla",
-            "/home/user/.config/tailscale-sunny_dolphin",
-        ]
-        mocker.patch("glob.glob", return_value=existing_profiles)
+        # Mock the directory scan to return existing profiles
+        existing_profiles = {"happy_gorilla", "sunny_dolphin"}
+        mocker.patch("tailsocks.manager._scan_profiles", return_value=existing_profiles)
 
         manager = TailscaleProxyManager()
 
@@ -53,8 +90,8 @@ class TestManagerInitialization:
 
     def test_generate_random_profile_name_uniqueness(self, mocker):
         """Test that random profile names are unique."""
-        # Mock glob to return no existing profiles
-        mocker.patch("glob.glob", return_value=[])
+        # Mock the directory scan to return no existing profiles
+        mocker.patch("tailsocks.manager._scan_profiles", return_value=set())
 
         # Instead of mocking random.choice, we'll mock the entire _generate_random_profile_name method
         # to return predictable unique values
@@ -162,6 +199,8 @@ class TestPlatformSpecificBehavior:
     def test_default_tailscales(self, mocker):
         """Test that default tailscale paths are set correctly based on platform."""
         manager = TailscaleProxyManager("test_profile")
+        mocker.patch.dict("tailsocks.manager._BIN_CACHE", clear=True)
+        mocker.patch("shutil.which", return_value=None)
 
         # Test macOS paths
         mocker.patch("platform.system", return_value="Darwin")
@@ -191,6 +230,28 @@ class TestPlatformSpecificBehavior:
         assert default_tailscaled == "tailscaled"
         assert default_tailscale == "tailscale"
 
+    def test_default_tailscales_found_on_path(self, mocker):
+        """Test that binaries missing from the default location are found on the PATH."""
+        manager = TailscaleProxyManager("test_profile")
+        mocker.patch.dict("tailsocks.manager._BIN_CACHE", clear=True)
+        mocker.patch("platform.system", return_value="Linux")
+        mocker.patch("os.path.exists", return_value=False)
+        mock_which = mocker.patch(
+            "shutil.which", side_effect=lambda name: f"/opt/tailscale/bin/{name}"
+        )
+
+        assert manager._default_tailscales() == (
+            "/opt/tailscale/bin/tailscaled",
+            "/opt/tailscale/bin/tailscale",
+        )
+
+        # The lookup is reused instead of searching the PATH again
+        assert manager._default_tailscales() == (
+            "/opt/tailscale/bin/tailscaled",
+            "/opt/tailscale/bin/tailscale",
+        )
+        assert mock_which.call_count == 2
+
     def test_auth_token_precedence(self, mock_manager, monkeypatch):
         """Test auth token precedence (config > environment)."""
         # Set environment variable
@@ -238,27 +299,140 @@ class TestConfigHandling:
         assert config["bind"] == "127.0.0.1:2020"
         assert config["tailscaled_args"] == ["--verbose=2"]
 
-    def test_create_default_config(self, mock_manager, mocker):
+    def test_load_config_utf8(self, mock_manager, temp_dir):
+        """Test that a UTF-8 config is decoded by the YAML loader itself."""
+        config_path = os.path.join(temp_dir, "config.yaml")
+        with open(config_path, "wb") as f:
+            f.write("hostname: café\n".encode("utf-8"))
+        mock_manager.config_path = config_path
+
+        assert mock_manager._load_config()["hostname"] == "café"
+
+    def test_load_config_uses_mtime_cache(self, mock_manager, temp_dir, mocker):
+        """Test that an unchanged config file is only parsed once."""
+        config_path = os.path.join(temp_dir, "config.yaml")
+        with open(config_path, "w") as f:
+            yaml.dump({"bind": "127.0.0.1:2020"}, f)
+        mock_manager.config_path = config_path
+
+        spy = mocker.spy(yaml, "load")
+        assert mock_manager._load_config()["bind"] == "127.0.0.1:2020"
+        assert mock_manager._load_config()["bind"] == "127.0.0.1:2020"
+        assert spy.call_count == 1
+
+        # Rewriting the file with a new mtime invalidates the cached parse
+        with open(config_path, "w") as f:
+            yaml.dump({"bind": "127.0.0.1:3030"}, f)
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert mock_manager._load_config()["bind"] == "127.0.0.1:3030"
+        assert spy.call_count == 2
+
+        # The new parse replaces the old one rather than sitting beside it
+        assert _YAML_CACHE[config_path][0] == os.stat(config_path).st_mtime_ns
+
+    @pytest.mark.parametrize("content", [b"null", b"42", b"[1, 2]"])
+    def test_load_state_non_object(self, mock_manager, content):
+        """Test that a state file holding valid JSON that isn't an object is ignored."""
+        with open(mock_manager.state_path, "wb") as f:
+            f.write(content)
+
+        assert mock_manager._load_state() == {}
+
+    def test_load_state_uses_cache(self, mocker):
+        """Test that unchanged state is parsed once and saving refreshes it."""
+        manager = TailscaleProxyManager("test_profile")
+        manager.port = 2020
+        manager._save_state()
+
+        spy = mocker.spy(json, "load")
+        assert manager._load_state()["port"] == 2020
+        assert manager._load_state()["port"] == 2020
+        assert spy.call_count == 1
+
+        # Saving drops the cached parse even if the mtime doesn't move
+        manager.port = 3030
+        manager._save_state()
+        assert manager._load_state()["port"] == 3030
+        assert spy.call_count == 2
+
+    def test_load_config_uses_json_sidecar(self, mock_manager, temp_dir, mocker):
+        """Test that a fresh JSON sidecar spares another process the YAML parse."""
+        config_path = os.path.join(temp_dir, "config.yaml")
+        with open(config_path, "w") as f:
+            yaml.dump({"bind": "127.0.0.1:2020"}, f)
+        mock_manager.config_path = config_path
+
+        assert mock_manager._load_config()["bind"] == "127.0.0.1:2020"
+        assert os.path.exists(os.path.join(mock_manager.cache_dir, "config.cache.json"))
+        assert not os.path.exists(os.path.join(temp_dir, "config.cache.json"))
+
+        # Simulate a new process with an empty in-memory cache
+        mocker.patch.dict("tailsocks.manager._YAML_CACHE", clear=True)
+        spy = mocker.spy(yaml, "load")
+
+        assert mock_manager._load_config()["bind"] == "127.0.0.1:2020"
+        assert spy.call_count == 0
+
+        # A replacement that keeps the old mtime is still noticed
+        stat = os.stat(config_path)
+        with open(config_path, "w") as f:
+            yaml.dump({"bind": "127.0.0.1:30303"}, f)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        mocker.patch.dict("tailsocks.manager._YAML_CACHE", clear=True)
+
+        assert mock_manager._load_config()["bind"] == "127.0.0.1:30303"
+        assert spy.call_count == 1
+
+    def test_load_config_skips_lossy_json_sidecar(self, mock_manager, temp_dir):
+        """Test that a config JSON can't represent faithfully is not cached."""
+        config_path = os.path.join(temp_dir, "config.yaml")
+        with open(config_path, "w") as f:
+            f.write("ports:\n  1080: socks\n")
+        mock_manager.config_path = config_path
+
+        assert mock_manager._load_config()["ports"] == {1080: "socks"}
+        assert not os.path.exists(
+            os.path.join(mock_manager.cache_dir, "config.cache.json")
+        )
+
+    def test_load_config_leaves_missing_cache_dir_alone(self, mock_manager, temp_dir):
+        """Test that reading a config doesn't create the cache directory."""
+        config_path = os.path.join(temp_dir, "config.yaml")
+        with open(config_path, "w") as f:
+            yaml.dump({"bind": "127.0.0.1:2020"}, f)
+        mock_manager.config_path = config_path
+        mock_manager.cache_dir = os.path.join(temp_dir, "missing")
+
+        assert mock_manager._load_config()["bind"] == "127.0.0.1:2020"
+        assert not os.path.exists(mock_manager.cache_dir)
+
+    def test_create_default_config(self, mock_manager, mocker, temp_dir):
         """Test creating a default configuration file."""
-        # Mock open and yaml.dump
-        mock_open = mocker.patch("builtins.open", mocker.mock_open())
-        mock_dump = mocker.patch("yaml.dump")
+        mock_manager.config_path = os.path.join(temp_dir, "config.yaml")
+        mock_manager.profile_name = "odd: name #1"
+        mock_dump = mocker.spy(yaml, "dump")
         mock_print = mocker.patch("builtins.print")
 
         # Call the method
         mock_manager._create_default_config()
 
-        # Verify the file was opened for writing
-        mock_open.assert_called_once_with(mock_manager.config_path, "w")
-
-        # Verify yaml.dump was called with expected default config
-        called_config = mock_dump.call_args[0][0]
-        assert "tailscaled_path" in called_config
-        assert "tailscale_path" in called_config
-        assert "socket_path" in called_config
-        assert "bind" in called_config
-        assert "tailscaled_args" in called_config
-        assert "tailscale_up_args" in called_config
+        # The file is written from a template rather than by the YAML dumper
+        mock_dump.assert_not_called()
+
+        default_tailscaled, default_tailscale = mock_manager._default_tailscales()
+        with open(mock_manager.config_path) as f:
+            assert yaml.safe_load(f) == {
+                "tailscaled_path": default_tailscaled,
+                "tailscale_path": default_tailscale,
+                "socket_path": os.path.join(mock_manager.cache_dir, "tailscaled.sock"),
+                "accept_routes": True,
+                "accept_dns": True,
+                "bind": "localhost:1080",
+                "tailscaled_args": ["--verbose=1"],
+                "tailscale_up_args": ["--hostname=odd: name #1-proxy"],
+            }
 
         # Verify the print message
         mock_print.assert_called_with(
@@ -297,7 +471,7 @@ class TestConfigHandling:
         assert config == {}
 
     def test_load_state_yaml_error(self, mock_manager, temp_dir, mocker):
-        """Test loading state with invalid YAML."""
+        """Test loading a legacy state file with invalid YAML."""
         state_path = os.path.join(temp_dir, "state.yml")
 
         # Create an invalid YAML file
@@ -305,9 +479,7 @@ class TestConfigHandling:
             f.write("invalid: 'yaml syntax")
 
         # Mock the state path
-        mocker.patch.object(mock_manager, "cache_dir", os.path.dirname(state_path))
-        mocker.patch("os.path.join", return_value=state_path)
-        mocker.patch("os.path.exists", return_value=True)
+        mocker.patch.object(mock_manager, "legacy_state_path", state_path)
 
         # Should handle the error gracefully
         state = mock_manager._load_state()
@@ -315,6 +487,16 @@ class TestConfigHandling:
         # Should return empty dict
         assert state == {}
 
+    def test_load_state_json_error(self, mock_manager, temp_dir, mocker, capsys):
+        """Test loading state with invalid JSON."""
+        state_path = os.path.join(temp_dir, "state.json")
+        with open(state_path, "w") as f:
+            f.write('{"port": ')
+        mocker.patch.object(mock_manager, "state_path", state_path)
+
+        assert mock_manager._load_state() == {}
+        assert "Error parsing state file" in capsys.readouterr().out
+
     def test_save_config_error(self, mock_manager, mocker):
         """Test saving configuration with an error."""
         # Mock open to raise an exception
@@ -362,6 +544,35 @@ class TestConfigHandling:
         assert result is True
         mock_open.assert_called_once_with(mock_manager.config_path, "w")
 
+    def test_state_round_trip_uses_json(self, mocker):
+        """Test that state is saved and loaded as JSON without YAML."""
+        manager = TailscaleProxyManager("test_profile")
+        mock_dump = mocker.spy(yaml, "dump")
+        mock_load = mocker.spy(yaml, "load")
+
+        manager._save_state()
+        state = manager._load_state()
+
+        assert state["profile_name"] == "test_profile"
+        assert state["port"] == manager.port
+        assert os.path.exists(os.path.join(manager.cache_dir, "state.json"))
+        mock_dump.assert_not_called()
+        mock_load.assert_not_called()
+
+    def test_load_state_migrates_legacy_yaml(self, mocker):
+        """Test that state.yml from an older version is read and then replaced."""
+        manager = TailscaleProxyManager("test_profile")
+        manager._ensure_dirs()
+        legacy_path = os.path.join(manager.cache_dir, "state.yml")
+        with open(legacy_path, "w") as f:
+            yaml.dump({"port": 2020, "bind_address": "127.0.0.1"}, f)
+
+        assert manager._load_state() == {"port": 2020, "bind_address": "127.0.0.1"}
+
+        assert manager._save_state() is True
+        assert not os.path.exists(legacy_path)
+        assert manager._load_state()["profile_name"] == "test_profile"
+
 
 class TestServerStatusChecks:
     def test_is_server_running_with_socket_and_pid(self, mock_manager, mocker):
@@ -370,8 +581,6 @@ class TestServerStatusChecks:
         mocker.patch.object(mock_manager, "_find_tailscaled_pid", return_value=12345)
 
         # Unmock _is_server_running to use the real implementation
-        from tailsocks.manager import TailscaleProxyManager
-
         mock_manager._is_server_running = (
             TailscaleProxyManager._is_server_running.__get__(mock_manager)
         )
@@ -393,8 +602,6 @@ class TestServerStatusChecks:
         mocker.patch("subprocess.run", side_effect=subprocess.SubprocessError())
 
         # Use the real implementation
-        from tailsocks.manager import TailscaleProxyManager
-
         mock_manager._is_server_running = (
             TailscaleProxyManager._is_server_running.__get__(mock_manager)
         )
@@ -406,51 +613,68 @@ class TestServerStatusChecks:
         assert result is False
 
     def test_is_server_running_socket_check(self, mock_manager, mocker):
-        """Test checking if server is running using socket check."""
+        """Test checking if server is running using a socket connection."""
         # Mock os.path.exists to return True (socket exists)
         mocker.patch("os.path.exists", return_value=True)
 
-        # Mock _find_tailscaled_pid to return None (no PID found)
-        mocker.patch.object(mock_manager, "_find_tailscaled_pid", return_value=None)
+        # The socket accepts a connection, so no process lookup is needed
+        mocker.patch("tailsocks.manager._unix_socket_accepting", return_value=True)
+        mock_find_pid = mocker.patch.object(mock_manager, "_find_tailscaled_pid")
+        mock_run = mocker.patch("subprocess.run")
 
-        # Mock subprocess.run for socket check
-        mock_process = mocker.MagicMock()
-        mock_process.returncode = 0  # Success
-        mocker.patch("subprocess.run", return_value=mock_process)
+        # Use the real implementation
+        mock_manager._is_server_running = (
+            TailscaleProxyManager._is_server_running.__get__(mock_manager)
+        )
 
-        # Call the method
-        result = mock_manager._is_server_running()
+        assert mock_manager._is_server_running() is True
+        mock_find_pid.assert_not_called()
+        mock_run.assert_not_called()
 
-        # Verify the result
-        assert result is True
+    def test_is_server_running_with_listening_socket(self, mocker, temp_dir):
+        """Test that a real listening unix socket is reported as running."""
+        if not hasattr(socket, "AF_UNIX"):
+            pytest.skip("unix sockets are not available")
 
-    def test_is_server_running_pgrep_fallback(self, mock_manager, mocker):
-        """Test checking if server is running using pgrep fallback."""
-        # Mock os.path.exists to return True (socket exists)
-        mocker.patch("os.path.exists", return_value=True)
+        manager = TailscaleProxyManager("test_profile")
+        manager.socket_path = os.path.join(temp_dir, "tailscaled.sock")
+        mock_find_pid = mocker.patch.object(manager, "_find_tailscaled_pid")
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+            listener.bind(manager.socket_path)
+            listener.listen(1)
 
-        # Mock _find_tailscaled_pid to return None (no PID found)
+            assert manager._is_server_running() is True
+        mock_find_pid.assert_not_called()
+
+    def test_is_server_running_stale_socket(self, mock_manager, mocker):
+        """Test that a socket nobody listens on and no process means not running."""
+        mocker.patch("os.path.exists", return_value=True)
+        mocker.patch("tailsocks.manager._unix_socket_accepting", return_value=False)
         mocker.patch.object(mock_manager, "_find_tailscaled_pid", return_value=None)
 
-        # Mock subprocess.run for socket check to raise an exception
-        mocker.patch(
-            "subprocess.run",
-            side_effect=[
-                subprocess.TimeoutExpired("cmd", 5),  # First call fails with timeout
-                mocker.MagicMock(
-                    returncode=0, stdout="12345\n"
-                ),  # Second call (pgrep) succeeds
-            ],
+        mock_manager._is_server_running = (
+            TailscaleProxyManager._is_server_running.__get__(mock_manager)
         )
 
-        # Mock platform.system to return Linux
-        mocker.patch("platform.system", return_value="Linux")
+        assert mock_manager._is_server_running() is False
 
-        # Call the method
-        result = mock_manager._is_server_running()
+    def test_is_server_running_reuses_recent_result(self, mocker):
+        """Test that repeated checks within the TTL don't probe again."""
+        manager = TailscaleProxyManager("test_profile")
+        mock_check = mocker.patch.object(
+            manager, "_check_server_running", return_value=True
+        )
 
-        # Verify the result
-        assert result is True
+        assert manager._is_server_running() is True
+        assert manager._is_server_running() is True
+        assert mock_check.call_count == 1
+
+        # An expired result is probed again
+        checked_at, running = manager._running_cache
+        manager._running_cache = (checked_at - 1, running)
+        assert manager._is_server_running() is True
+        assert mock_check.call_count == 2
 
     def test_is_server_running_no_socket(self, mock_manager, mocker):
         """Test checking if server is running when socket doesn't exist."""
@@ -462,18 +686,54 @@ class TestServerStatusChecks:
         """Test checking if a port is in use."""
         manager = TailscaleProxyManager("test_profile")
 
-        # Create a mock socket object
+        # Create a mock socket object whose bind fails (port in use)
         mock_socket = MagicMock()
-        mock_socket.__enter__.return_value.connect_ex.return_value = 0  # Port in use
+        mock_socket.__enter__.return_value.bind.side_effect = OSError(
+            errno.EADDRINUSE, "Address already in use"
+        )
         mocker.patch("socket.socket", return_value=mock_socket)
 
         assert manager._is_port_in_use(1080) is True
 
         # Test port not in use
-        mock_socket.__enter__.return_value.connect_ex.return_value = (
-            1  # Port not in use
-        )
+        mock_socket.__enter__.return_value.bind.side_effect = None
+        assert manager._is_port_in_use(1080) is False
+
+    def test_is_port_in_use_sets_reuseaddr(self, mocker):
+        """Test that the probe ignores lingering TIME_WAIT connections on POSIX."""
+        manager = TailscaleProxyManager("test_profile")
+        mock_socket = MagicMock()
+        mocker.patch("socket.socket", return_value=mock_socket)
+        mocker.patch("os.name", "posix")
+
         assert manager._is_port_in_use(1080) is False
+        mock_socket.__enter__.return_value.setsockopt.assert_called_once_with(
+            socket.SOL_SOCKET, socket.SO_REUSEADDR, 1
+        )
+
+    def test_is_port_in_use_with_listener(self):
+        """Test that a real listening socket is reported as in use."""
+        manager = TailscaleProxyManager("test_profile")
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(1)
+            port = listener.getsockname()[1]
+
+            assert manager._is_port_in_use(port) is True
+
+    def test_is_port_in_use_probes_bind_address(self):
+        """Test that the configured bind address is probed rather than loopback."""
+        manager = TailscaleProxyManager("test_profile")
+        manager.bind_address = "0.0.0.0"
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(1)
+            port = listener.getsockname()[1]
+
+            # A wildcard bind conflicts with a listener on any interface
+            assert manager._is_port_in_use(port) is True
 
 
 class TestStatusReporting:
@@ -487,6 +747,155 @@ class TestStatusReporting:
         assert status["ip_address"] == "100.100.100.100"
         assert "bind" in status
 
+    def test_get_status_single_status_probe(self, mock_running_manager, mocker):
+        """Test that a successful status query skips the separate liveness check."""
+        mock_run = mocker.patch(
+            "subprocess.run",
+            return_value=MagicMock(returncode=0, stdout='{"BackendState": "Running"}'),
+        )
+
+        status = mock_running_manager.get_status()
+
+        assert status["server_running"] is True
+        assert status["session_up"] is True
+        assert mock_run.call_count == 1
+        mock_running_manager._is_server_running.assert_not_called()
+
+        # The successful query also answers later liveness checks
+        assert mock_running_manager._running_cache[1] is True
+
+    def test_get_status_stale_socket_skips_cli(self, temp_dir, mocker):
+        """Test that a socket file with no daemon behind it isn't queried via the CLI."""
+        manager = TailscaleProxyManager("test_profile")
+        manager.cache_dir = temp_dir
+        manager.socket_path = os.path.join(temp_dir, "tailscaled.sock")
+        open(manager.socket_path, "w").close()
+        mock_find_pid = mocker.patch.object(
+            manager, "_find_tailscaled_pid", return_value=None
+        )
+        mock_run = mocker.patch("subprocess.run")
+
+        status = manager.get_status()
+
+        assert status["server_running"] is False
+        assert status["session_up"] is False
+        mock_run.assert_not_called()
+        # The liveness check reuses the answer instead of scanning again
+        assert mock_find_pid.call_count == 1
+
+    def test_get_status_uses_localapi(self, mock_running_manager, mocker):
+        """Test that status is read from the LocalAPI socket without the CLI."""
+        requests = []
+
+        class LocalAPIHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests.append((self.path, self.headers["Host"]))
+                body = (
+                    b'{"BackendState": "Running",'
+                    b' "Self": {"TailscaleIPs": ["100.64.0.1"]}}'
+                )
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def address_string(self):
+                return "localapi"
+
+            def log_message(self, *args):
+                pass
+
+        os.remove(mock_running_manager.socket_path)
+        server = socketserver.UnixStreamServer(
+            mock_running_manager.socket_path, LocalAPIHandler
+        )
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        mock_run = mocker.patch("subprocess.run")
+
+        try:
+            status = mock_running_manager.get_status()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert status["session_up"] is True
+        assert status["ip_address"] == "100.64.0.1"
+        assert requests == [("/localapi/v0/status", "local-tailscaled.sock")]
+        mock_run.assert_not_called()
+
+    def test_get_status_uses_recent_snapshot(self, mock_running_manager, mocker):
+        """Test that a fresh status snapshot is served without probing."""
+        mocker.patch("tailsocks.manager._unix_socket_accepting", return_value=True)
+        status_path = os.path.join(mock_running_manager.cache_dir, "status.json")
+
+        # Reading the status never writes a snapshot
+        first = mock_running_manager.get_status()
+        assert not os.path.exists(status_path)
+
+        mock_running_manager._refresh_cached_status()
+        mock_run = mocker.patch("subprocess.run")
+        assert mock_running_manager.get_status() == first
+        mock_run.assert_not_called()
+
+        # A stale snapshot is ignored and the daemon is probed again
+        os.utime(status_path, (0, 0))
+        mock_running_manager.get_status()
+        mock_run.assert_called_once()
+
+    def test_status_snapshot_checks_socket(self, mock_running_manager):
+        """Test that a snapshot is ignored once tailscaled stops answering."""
+        os.remove(mock_running_manager.socket_path)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(mock_running_manager.socket_path)
+        listener.listen(1)
+        try:
+            mock_running_manager._save_cached_status({"server_running": True})
+            assert _read_status_snapshot(mock_running_manager.cache_dir) == {
+                "server_running": True
+            }
+        finally:
+            listener.close()
+
+        # e.g. tailscaled was killed with SIGKILL and left its socket behind
+        assert _read_status_snapshot(mock_running_manager.cache_dir) is None
+
+    @pytest.mark.parametrize("content", [b"null", b"[]", b'{"status": 1}'])
+    def test_status_snapshot_rejects_malformed(self, mock_manager, content):
+        """Test that a snapshot that isn't a status object is ignored."""
+        os.makedirs(mock_manager.cache_dir, exist_ok=True)
+        with open(os.path.join(mock_manager.cache_dir, "status.json"), "wb") as f:
+            f.write(content)
+
+        assert _read_status_snapshot(mock_manager.cache_dir) is None
+
+    def test_stop_server_snapshots_status(self, mock_running_manager, mocker):
+        """Test that stopping the server leaves a snapshot saying so."""
+        mocker.patch.object(mock_running_manager, "_wait_for_exit", return_value=True)
+        mocker.patch("os.kill")
+        mocker.patch.object(
+            mock_running_manager,
+            "_probe_status",
+            return_value={"server_running": False},
+        )
+        mock_save = mocker.patch.object(mock_running_manager, "_save_cached_status")
+
+        assert mock_running_manager.stop_server() is True
+        mock_save.assert_called_once_with({"server_running": False})
+
+    def test_stop_session_invalidates_snapshot(self, mock_running_manager, mocker):
+        """Test that changing the session discards the status snapshot."""
+        mock_running_manager._save_cached_status({"server_running": True})
+        status_path = os.path.join(mock_running_manager.cache_dir, "status.json")
+        assert os.path.exists(status_path)
+
+        mocker.patch("subprocess.run", return_value=MagicMock(returncode=0))
+        assert mock_running_manager.stop_session() is True
+
+        assert not os.path.exists(status_path)
+
     def test_get_status_server_not_running(self, mock_manager):
         """Test getting status when server is not running."""
         status = mock_manager.get_status()
@@ -563,8 +972,6 @@ class TestServerManagement:
         mocker.patch.object(mock_manager, "_is_port_in_use", side_effect=[True, False])
 
         # Use the real implementation instead of a mock
-        from tailsocks.manager import TailscaleProxyManager
-
         mock_manager._ensure_available_port = (
             TailscaleProxyManager._ensure_available_port.__get__(mock_manager)
         )
@@ -587,8 +994,6 @@ class TestServerManagement:
         mocker.patch.object(mock_manager, "_is_port_in_use", return_value=True)
 
         # Use the real implementation
-        from tailsocks.manager import TailscaleProxyManager
-
         mock_manager._ensure_available_port = (
             TailscaleProxyManager._ensure_available_port.__get__(mock_manager)
         )
@@ -603,17 +1008,74 @@ class TestServerManagement:
         assert "Error: Configured port" in captured.out
         assert "is already in use" in captured.out
 
+    def test_ensure_available_port_skips_listening_ports(self, mock_manager, mocker):
+        """Test that ports with a known listener aren't probed again."""
+        mock_manager.config = {"bind": "localhost:1080"}
+        mock_manager.port = 1080
+        mocker.patch(
+            "tailsocks.manager._listening_tcp_ports", return_value={1080, 1081, 1082}
+        )
+        mock_in_use = mocker.patch.object(
+            mock_manager, "_is_port_in_use", side_effect=[True, False]
+        )
+
+        mock_manager._ensure_available_port = (
+            TailscaleProxyManager._ensure_available_port.__get__(mock_manager)
+        )
+
+        assert mock_manager._ensure_available_port() is True
+        assert mock_manager.port == 1083
+        assert [c.args[0] for c in mock_in_use.call_args_list] == [1080, 1083]
+
+    def test_listening_tcp_ports(self, temp_dir):
+        """Test that only LISTEN entries that collide with the bind address count."""
+        tcp_path = os.path.join(temp_dir, "tcp")
+        with open(tcp_path, "w") as f:
+            f.write(
+                "  sl  local_address rem_address   st\n"
+                "   0: 0100007F:0438 00000000:0000 0A\n"
+                "   1: 0100007F:0439 0100007F:D431 01\n"
+                "   2: 00000000:043A 00000000:0000 0A\n"
+                "   3: 0101A8C0:043B 00000000:0000 0A\n"
+            )
+        tcp6_path = os.path.join(temp_dir, "tcp6")
+        with open(tcp6_path, "w") as f:
+            f.write(
+                "  sl  local_address rem_address   st\n"
+                "   0: 00000000000000000000000001000000:043C "
+                "00000000000000000000000000000000:0000 0A\n"
+                "   1: 0000000000000000FFFF00000100007F:043D "
+                "00000000000000000000000000000000:0000 0A\n"
+            )
+        paths = (tcp_path, tcp6_path, os.path.join(temp_dir, "missing"))
+
+        # 127.0.0.1 directly or v4-mapped, and the IPv4 wildcard
+        assert _listening_tcp_ports("127.0.0.1", socket.AF_INET, paths) == {
+            1080,
+            1082,
+            1085,
+        }
+        # A wildcard bind collides with every IPv4 listener
+        assert _listening_tcp_ports("0.0.0.0", socket.AF_INET, paths) == {
+            1080,
+            1082,
+            1083,
+            1085,
+        }
+        assert _listening_tcp_ports("::1", socket.AF_INET6, paths) == {1084}
+        # Hostnames can't be matched, so every port is left to the bind probe
+        assert _listening_tcp_ports("example", socket.AF_INET, paths) == set()
+
     def test_ensure_available_port_finds_free_port(self, mock_manager, mocker):
         """Test that ensure_available_port finds a free port when needed."""
-        # Mock port_in_use to return True for the first port and False for the second
-        mocker.patch.object(mock_manager, "_is_port_in_use", side_effect=[True, False])
+        # Mock port_in_use to report the default port as taken
+        mocker.patch.object(mock_manager, "_is_port_in_use", return_value=True)
+        mocker.patch.object(mock_manager, "_pick_ephemeral_port", return_value=40123)
 
         # Set initial port
         mock_manager.port = 1080
 
         # Use the real implementation
-        from tailsocks.manager import TailscaleProxyManager
-
         mock_manager._ensure_available_port = (
             TailscaleProxyManager._ensure_available_port.__get__(mock_manager)
         )
@@ -623,8 +1085,34 @@ class TestServerManagement:
 
         # Should succeed
         assert result is True
-        # Should have incremented the port
-        assert mock_manager.port == 1081
+        # Should have switched to the kernel-assigned port
+        assert mock_manager.port == 40123
+
+    def test_ensure_available_port_default_port_free(self, mock_manager, mocker):
+        """Test that the default port is kept when it is available."""
+        mock_pick = mocker.patch.object(mock_manager, "_pick_ephemeral_port")
+        mock_manager.port = 1080
+
+        assert mock_manager._ensure_available_port() is True
+        assert mock_manager.port == 1080
+        mock_pick.assert_not_called()
+
+    def test_pick_ephemeral_port(self, mock_manager):
+        """Test that the kernel-assigned port is usable."""
+        port = mock_manager._pick_ephemeral_port()
+
+        assert 0 < port < 65536
+
+    def test_pick_ephemeral_port_uses_bind_address(self, mock_manager, mocker):
+        """Test that the port is picked on the address tailscaled will bind."""
+        mock_manager.bind_address = "[::1]"
+        mock_socket = MagicMock()
+        mock_socket.__enter__.return_value.getsockname.return_value = ("::1", 40123)
+        mock_socket_class = mocker.patch("socket.socket", return_value=mock_socket)
+
+        assert mock_manager._pick_ephemeral_port() == 40123
+        mock_socket_class.assert_called_once_with(socket.AF_INET6, socket.SOCK_STREAM)
+        mock_socket.__enter__.return_value.bind.assert_called_once_with(("::1", 0))
 
     def test_start_tailscaled_process(self, mock_manager, mocker):
         """Test starting the tailscaled process."""
@@ -658,21 +1146,64 @@ class TestServerManagement:
         assert result is True
         assert mock_manager.tailscaled_process == mock_popen
 
+    def test_wait_for_socket(self, mock_manager):
+        """Test waiting for the socket returns early on readiness or exit."""
+        mock_manager.socket_path = os.path.join(mock_manager.cache_dir, "ts.sock")
+        mock_manager.tailscaled_process = MagicMock()
+        mock_manager.tailscaled_process.wait.side_effect = subprocess.TimeoutExpired(
+            "tailscaled", 0.025
+        )
+
+        # Socket never appears while the process keeps running
+        assert mock_manager._wait_for_socket(timeout=0.1) is False
+        assert mock_manager.tailscaled_process.wait.call_count == 4
+
+        # A stale socket file that nothing is listening on is not ready
+        open(mock_manager.socket_path, "w").close()
+        mock_manager.tailscaled_process.wait.reset_mock()
+        assert mock_manager._wait_for_socket(timeout=0.05) is False
+        assert mock_manager.tailscaled_process.wait.call_count == 2
+        os.remove(mock_manager.socket_path)
+
+        # Socket is listening
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+            listener.bind(mock_manager.socket_path)
+            listener.listen(1)
+            assert mock_manager._wait_for_socket() is True
+
+        # Process exits before creating the socket
+        os.remove(mock_manager.socket_path)
+        mock_manager.tailscaled_process = subprocess.Popen(["true"])
+        assert mock_manager._wait_for_socket() is False
+
     def test_start_tailscaled_process_failure(self, mock_manager, mocker, capsys):
         """Test starting the tailscaled process when it fails."""
         # Mock subprocess.Popen
         mock_popen = MagicMock()
         mock_popen.poll.return_value = 1  # Process failed
-        mock_popen.communicate.return_value = ("", "Error starting tailscaled")
-        mocker.patch("subprocess.Popen", return_value=mock_popen)
+
+        def fake_popen(cmd, stdout, **kwargs):
+            stdout.write(b"Error starting tailscaled\n")
+            stdout.flush()
+            return mock_popen
+
+        # The log is truncated, so output from a previous run is not reported again
+        log_path = os.path.join(mock_manager.cache_dir, "tailscaled.log")
+        with open(log_path, "wb") as f:
+            f.write(b"Output from an earlier run\n")
+
+        mock_popen_class = mocker.patch("subprocess.Popen", side_effect=fake_popen)
         mocker.patch("time.sleep")
 
         result = mock_manager._start_tailscaled_process()
 
         assert result is False
+        assert mock_popen_class.call_args.kwargs["stderr"] == subprocess.STDOUT
+        assert mock_popen_class.call_args.kwargs["start_new_session"] is True
 
         captured = capsys.readouterr()
-        assert "Failed to start tailscaled" in captured.out
+        assert "Failed to start tailscaled: Error starting tailscaled" in captured.out
+        assert "earlier run" not in captured.out
 
 
 class TestSessionManagement:
@@ -739,10 +1270,13 @@ class TestSessionManagement:
         # Mock subprocess.run
         mock_process = MagicMock()
         mock_process.returncode = 0
-        mocker.patch("subprocess.run", return_value=mock_process)
+        mock_run = mocker.patch("subprocess.run", return_value=mock_process)
 
         assert mock_running_manager.stop_session() is True
 
+        # stdout is never read, so it should not be captured
+        assert mock_run.call_args.kwargs["stdout"] == subprocess.DEVNULL
+
     def test_stop_session_failure(self, mock_running_manager, mocker, capsys):
         """Test stopping a session when it fails."""
         # Mock subprocess.run
@@ -760,17 +1294,22 @@ class TestSessionManagement:
 class TestServerShutdown:
     def test_stop_server_success(self, mock_running_manager, mocker):
         """Test stopping the server successfully."""
-        # Mock os.kill
-        mocker.patch("os.kill")
-        mocker.patch("time.sleep")
 
-        # First call to _is_server_running returns True, second returns False
-        mocker.patch.object(
-            mock_running_manager, "_is_server_running", side_effect=[True, False]
-        )
+        # The process is gone as soon as it has been sent SIGTERM
+        def kill_side_effect(pid, sig):
+            if sig == 0:
+                raise ProcessLookupError()
+
+        mock_kill = mocker.patch("os.kill", side_effect=kill_side_effect)
+        mocker.patch("time.sleep")
+        mocker.patch.object(mock_running_manager, "_wait_for_pidfd", return_value=None)
 
         assert mock_running_manager.stop_server() is True
 
+        # Should not have needed SIGKILL
+        signals = [args[1] for args, _ in mock_kill.call_args_list]
+        assert signals == [signal.SIGTERM, 0]
+
     def test_stop_server_not_running(self, mock_manager, mocker, capsys):
         """Test stopping the server when it's not running."""
         mocker.patch.object(mock_manager, "_is_server_running", return_value=False)
@@ -785,6 +1324,7 @@ class TestServerShutdown:
         # Mock os.kill
         mock_kill = mocker.patch("os.kill")
         mocker.patch("time.sleep")
+        mocker.patch.object(mock_running_manager, "_wait_for_pidfd", return_value=None)
 
         # Server keeps running after SIGTERM
         mocker.patch.object(
@@ -795,10 +1335,54 @@ class TestServerShutdown:
 
         assert mock_running_manager.stop_server() is True
 
-        # Should have called kill with SIGKILL
-        assert mock_kill.call_count == 2
-        args, kwargs = mock_kill.call_args_list[1]
-        assert args[1] == 9  # SIGKILL
+        # Should have called kill with SIGKILL after SIGTERM
+        signals = [args[1] for args, _ in mock_kill.call_args_list if args[1] != 0]
+        assert signals == [signal.SIGTERM, signal.SIGKILL]
+
+    @pytest.mark.skipif(
+        not hasattr(os, "pidfd_open"), reason="pidfd_open is Linux-only"
+    )
+    def test_wait_for_pidfd(self, mock_manager):
+        """Test that pidfd waiting notices a process exit."""
+        process = subprocess.Popen(["sleep", "5"])
+        try:
+            assert mock_manager._wait_for_pidfd(process.pid, 0.05) is False
+
+            process.terminate()
+            assert mock_manager._wait_for_pidfd(process.pid, 5) is True
+        finally:
+            process.kill()
+            process.wait()
+
+    def test_stop_server_waits_on_own_process(self, mock_running_manager, mocker):
+        """Test that a tailscaled we spawned is waited on directly."""
+        mock_kill = mocker.patch("os.kill")
+        mock_running_manager.tailscaled_process = MagicMock(pid=12345)
+
+        assert mock_running_manager.stop_server() is True
+
+        mock_running_manager.tailscaled_process.wait.assert_called_once_with(
+            timeout=5.0
+        )
+        mock_kill.assert_called_once_with(12345, signal.SIGTERM)
+
+    def test_stop_server_reaps_own_process_after_sigkill(
+        self, mock_running_manager, mocker
+    ):
+        """Test that a tailscaled we spawned is waited on again after SIGKILL."""
+        mock_kill = mocker.patch("os.kill")
+        process = MagicMock(pid=12345)
+        process.wait.side_effect = [subprocess.TimeoutExpired("tailscaled", 5), 0]
+        mock_running_manager.tailscaled_process = process
+
+        assert mock_running_manager.stop_server() is True
+
+        signals = [args[1] for args, _ in mock_kill.call_args_list]
+        assert signals == [signal.SIGTERM, signal.SIGKILL]
+        assert process.wait.call_args_list == [
+            mocker.call(timeout=5.0),
+            mocker.call(timeout=1.0),
+        ]
 
 
 class TestErrorHandling:
@@ -846,24 +1430,90 @@ class TestErrorHandling:
         mock_print.assert_called_once()
         mock_logger.error.assert_called_once()
 
+    def test_announce(self, mock_manager, mocker):
+        """Test that a progress message is printed and logged once each."""
+        mock_print = mocker.patch("builtins.print")
+        mock_manager.logger = mocker.MagicMock()
+
+        mock_manager._announce("Tailscaled started successfully")
+
+        mock_print.assert_called_once_with("Tailscaled started successfully")
+        mock_manager.logger.info.assert_called_once_with(
+            "Tailscaled started successfully"
+        )
+
 
 class TestProcessManagement:
-    def test_find_tailscaled_pid_linux(self, mock_manager, mocker):
-        """Test finding tailscaled PID on Linux/macOS."""
-        # Mock platform.system to return Linux
+    def test_find_tailscaled_pid_linux(self, mocker):
+        """Test finding tailscaled PID on Linux reads /proc instead of running pgrep."""
+        manager = TailscaleProxyManager("test_profile")
         mocker.patch("platform.system", return_value="Linux")
+        mocker.patch("os.path.isdir", return_value=True)
+        mock_scan = mocker.patch.object(
+            manager, "_find_tailscaled_pid_in_proc", return_value=12345
+        )
+        mock_run = mocker.patch("subprocess.run")
+
+        assert manager._find_tailscaled_pid() == 12345
+        mock_scan.assert_called_once()
+        mock_run.assert_not_called()
+
+    def test_find_tailscaled_pid_in_proc(self, temp_dir):
+        """Test matching tailscaled command lines in a /proc-like directory."""
+        manager = TailscaleProxyManager("test_profile")
+        manager.socket_path = "/tmp/test_profile/tailscaled.sock"
+
+        cmdlines = {
+            "50": b"tailscaled\0--socket\0/tmp/other/tailscaled.sock\0",
+            "100": b"sleep\0/tmp/test_profile/tailscaled.sock\0",
+            "200": b"tailscaled\0--socket\0/tmp/test_profile/tailscaled.sock\0",
+            "300": b"tailscaled\0--socket=/tmp/test_profile/tailscaled.sock\0",
+        }
+        for pid, cmdline in cmdlines.items():
+            os.mkdir(os.path.join(temp_dir, pid))
+            with open(os.path.join(temp_dir, pid, "cmdline"), "wb") as f:
+                f.write(cmdline)
+        os.mkdir(os.path.join(temp_dir, "self"))
+
+        # The lowest matching PID wins, like pgrep's output order
+        assert manager._find_tailscaled_pid_in_proc(temp_dir) == 200
+
+        # The PID from the last scan is rechecked instead of scanning again
+        os.mkdir(os.path.join(temp_dir, "150"))
+        with open(os.path.join(temp_dir, "150", "cmdline"), "wb") as f:
+            f.write(cmdlines["200"])
+        assert manager._find_tailscaled_pid_in_proc(temp_dir) == 200
+
+        # Once it is gone, the next lookup scans again
+        os.remove(os.path.join(temp_dir, "200", "cmdline"))
+        assert manager._find_tailscaled_pid_in_proc(temp_dir) == 150
+
+        manager.socket_path = "/tmp/missing/tailscaled.sock"
+        assert manager._find_tailscaled_pid_in_proc(temp_dir) is None
+        assert manager._find_tailscaled_pid_in_proc("/nonexistent") is None
+
+    def test_find_tailscaled_pid_macos(self, mocker):
+        """Test finding tailscaled PID on macOS."""
+        manager = TailscaleProxyManager("test_profile")
+        # Mock platform.system to return Darwin
+        mocker.patch("platform.system", return_value="Darwin")
 
         # Mock subprocess.run to return a valid PID
         mock_process = mocker.MagicMock()
         mock_process.returncode = 0
         mock_process.stdout = "12345\n"
-        mocker.patch("subprocess.run", return_value=mock_process)
+        mock_run = mocker.patch("subprocess.run", return_value=mock_process)
 
         # Call the method
-        pid = mock_manager._find_tailscaled_pid()
+        pid = manager._find_tailscaled_pid()
 
         # Verify the result
         assert pid == 12345
+        assert mock_run.call_args[0][0] == [
+            "pgrep",
+            "-f",
+            f"tailscaled.*{manager.socket_path}",
+        ]
 
     def test_find_tailscaled_pid_windows(self, mock_manager, mocker):
         """Test finding tailscaled PID on Windows."""
@@ -884,8 +1534,8 @@ class TestProcessManagement:
 
     def test_find_tailscaled_pid_error(self, mock_manager, mocker):
         """Test finding tailscaled PID with an error."""
-        # Mock platform.system to return Linux
-        mocker.patch("platform.system", return_value="Linux")
+        # Mock platform.system to return Darwin
+        mocker.patch("platform.system", return_value="Darwin")
 
         # Mock subprocess.run to raise an exception
         mocker.patch("subprocess.run", side_effect=subprocess.SubprocessError())
@@ -896,22 +1546,28 @@ class TestProcessManagement:
         # Verify the result
         assert pid is None
 
-    def test_find_tailscaled_pid_multiple_results(self, mock_manager, mocker):
+    def test_find_tailscaled_pid_multiple_results(self, mocker):
         """Test finding tailscaled PID when multiple processes match."""
-        # Mock platform.system to return Linux
-        mocker.patch("platform.system", return_value="Linux")
+        manager = TailscaleProxyManager("test_profile")
+        # Mock platform.system to return Darwin
+        mocker.patch("platform.system", return_value="Darwin")
 
         # Mock subprocess.run to return multiple PIDs
         mock_process = mocker.MagicMock()
         mock_process.returncode = 0
         mock_process.stdout = "12345\n67890\n"
-        mocker.patch("subprocess.run", return_value=mock_process)
+        mock_run = mocker.patch("subprocess.run", return_value=mock_process)
 
         # Call the method
-        pid = mock_manager._find_tailscaled_pid()
+        pid = manager._find_tailscaled_pid()
 
         # Should return the first PID
         assert pid == 12345
+        assert mock_run.call_args[0][0] == [
+            "pgrep",
+            "-f",
+            f"tailscaled.*{manager.socket_path}",
+        ]
 
 
 class TestProfileDeletion:
@@ -943,6 +1599,16 @@ class TestProfileDeletion:
         # Verify print messages
         assert mock_print.call_count == 2
 
+    def test_delete_profile_missing_directories(self, mock_manager, mocker):
+        """Test deleting a profile whose directories are already gone."""
+        mock_manager.config_dir = "/nonexistent/tailscale-test_profile"
+        mock_manager.cache_dir = "/nonexistent/cache/tailscale-test_profile"
+        mocker.patch.object(mock_manager, "_is_server_running", return_value=False)
+        mock_print = mocker.patch("builtins.print")
+
+        assert mock_manager.delete_profile() is True
+        mock_print.assert_not_called()
+
     def test_delete_profile_server_running(self, mock_manager, mocker):
         """Test profile deletion when server is running."""
         # Mock _is_server_running to return True
@@ -992,18 +1658,12 @@ class TestProfileDeletion:
 class TestProfileManagement:
     def test_get_all_profiles(self, mocker):
         """Test getting all profiles."""
-        # Mock glob.glob to return some profile directories
+        # Mock the directory scan to return some profile names
         mocker.patch(
-            "glob.glob",
+            "tailsocks.manager._scan_profiles",
             side_effect=[
-                [
-                    "/home/user/.config/tailscale-test_profile1",
-                    "/home/user/.config/tailscale-test_profile2",
-                ],
-                [
-                    "/home/user/.cache/tailscale-test_profile1",
-                    "/home/user/.cache/tailscale-test_profile3",
-                ],
+                {"test_profile1", "test_profile2"},
+                {"test_profile1", "test_profile3"},
             ],
         )
 
@@ -1013,32 +1673,49 @@ class TestProfileManagement:
             TailscaleProxyManager, "get_status", return_value=mock_status
         )
 
+        mock_makedirs = mocker.patch("os.makedirs")
+
         profiles = get_all_profiles()
 
+        # Status reporting must not create profile directories
+        mock_makedirs.assert_not_called()
+
         # Should have 3 unique profiles
         assert len(profiles) == 3
         for profile in profiles:
             assert profile == mock_status
 
-    def test_generate_random_profile_name_max_attempts(self, mock_manager, mocker):
-        """Test profile name generation when max attempts are reached."""
-        # Mock glob to return many existing profiles
-        existing_profiles = [f"test_profile_{i}" for i in range(20)]
+    def test_scan_profiles(self, temp_dir):
+        """Test that only tailscale-* directories are reported as profiles."""
+        os.mkdir(os.path.join(temp_dir, "tailscale-test_profile1"))
+        os.mkdir(os.path.join(temp_dir, "unrelated"))
+        open(os.path.join(temp_dir, "tailscale-not_a_dir"), "w").close()
+
+        assert _scan_profiles(temp_dir) == {"test_profile1"}
+        assert _scan_profiles(os.path.join(temp_dir, "missing")) == set()
+        assert _scan_profiles(os.path.join(temp_dir, "tailscale-not_a_dir")) == set()
+
+    def test_get_all_profiles_uses_status_snapshot(self, mocker):
+        """Test that a fresh status snapshot skips building a manager."""
         mocker.patch(
-            "glob.glob",
-            return_value=[
-                f"/home/user/.config/tailscale-{p}" for p in existing_profiles
-            ],
+            "tailsocks.manager._scan_profiles",
+            side_effect=[{"test_profile1"}, set()],
+        )
+        mock_status = {"profile_name": "test_profile1", "server_running": True}
+        mocker.patch(
+            "tailsocks.manager._read_status_snapshot", return_value=mock_status
         )
+        mock_manager_class = mocker.patch("tailsocks.manager.TailscaleProxyManager")
 
-        # Mock random.choice to return predictable values that will always match existing profiles
-        # for the first 10 attempts, then a unique value
-        choices = existing_profiles[:10] + ["unique_profile"]
-        mocker.patch("random.choice", side_effect=lambda x: choices.pop(0))
+        assert get_all_profiles() == [mock_status]
+        mock_manager_class.assert_not_called()
 
-        # Use the real implementation
-        from tailsocks.manager import TailscaleProxyManager
+    def test_generate_random_profile_name_max_attempts(self, mock_manager, mocker):
+        """Test profile name generation when every combination is taken."""
+        existing_profiles = {f"test_{a}_{n}" for a in _ADJECTIVES for n in _ANIMALS}
+        mocker.patch("tailsocks.manager._scan_profiles", return_value=existing_profiles)
 
+        # Use the real implementation
         mock_manager._generate_random_profile_name = (
             TailscaleProxyManager._generate_random_profile_name.__get__(mock_manager)
         )
@@ -1046,9 +1723,10 @@ class TestProfileManagement:
         # Generate a profile name
         name = mock_manager._generate_random_profile_name()
 
-        # Should contain a random number since we exhausted the simple combinations
-        assert "_" in name
-        assert any(c.isdigit() for c in name)
+        # Should be numbered since we exhausted the simple combinations
+        assert name not in existing_profiles
+        assert name.rsplit("_", 1)[0] in existing_profiles
+        assert name.endswith("_1")
 
     def test_cleanup_test_profiles(self, mocker):
         """Test that test profiles are properly identified for cleanup."""